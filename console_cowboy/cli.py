@@ -429,7 +429,7 @@ def cli(
     else:
         # Output as terminal config
         try:
-            output = dest_adapter.export(ctec)
+            output = dest_adapter.export(ctec, quiet=quiet)
         except Exception as e:
             raise click.ClickException(f"Failed to export to {dest_adapter.name}: {e}")
 
@@ -685,7 +685,7 @@ def import_config(
 
     # Export to terminal format
     try:
-        output = dest_adapter.export(ctec)
+        output = dest_adapter.export(ctec, quiet=quiet)
     except Exception as e:
         raise click.ClickException(f"Failed to export to {dest_adapter.name}: {e}")
 
@@ -833,7 +833,7 @@ def convert_config(
     else:
         # Output as terminal config
         try:
-            output = dest_adapter.export(ctec)
+            output = dest_adapter.export(ctec, quiet=quiet)
         except Exception as e:
             raise click.ClickException(f"Failed to export to {dest_adapter.name}: {e}")
 
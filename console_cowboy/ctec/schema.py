@@ -7,6 +7,7 @@ intermediate representation for terminal emulator settings.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 
 class CursorStyle(Enum):
@@ -58,44 +59,48 @@ class FontWeight(Enum):
         except ValueError:
             pass
 
-        name_map = {
-            "thin": cls.THIN,
-            "extralight": cls.EXTRA_LIGHT,
-            "extra-light": cls.EXTRA_LIGHT,
-            "ultralight": cls.EXTRA_LIGHT,
-            "light": cls.LIGHT,
-            "regular": cls.REGULAR,
-            "normal": cls.REGULAR,
-            "medium": cls.MEDIUM,
-            "semibold": cls.SEMI_BOLD,
-            "semi-bold": cls.SEMI_BOLD,
-            "demibold": cls.SEMI_BOLD,
-            "bold": cls.BOLD,
-            "extrabold": cls.EXTRA_BOLD,
-            "extra-bold": cls.EXTRA_BOLD,
-            "ultrabold": cls.EXTRA_BOLD,
-            "black": cls.BLACK,
-            "heavy": cls.BLACK,
-        }
-        result = name_map.get(name.lower().replace(" ", ""))
+        result = _FONT_WEIGHT_ALIASES.get(name.lower().replace(" ", ""))
         if result is None:
             raise ValueError(f"Unknown font weight: {name}")
         return result
 
     def to_string(self) -> str:
         """Convert to human-readable weight name."""
-        name_map = {
-            FontWeight.THIN: "Thin",
-            FontWeight.EXTRA_LIGHT: "ExtraLight",
-            FontWeight.LIGHT: "Light",
-            FontWeight.REGULAR: "Regular",
-            FontWeight.MEDIUM: "Medium",
-            FontWeight.SEMI_BOLD: "SemiBold",
-            FontWeight.BOLD: "Bold",
-            FontWeight.EXTRA_BOLD: "ExtraBold",
-            FontWeight.BLACK: "Black",
-        }
-        return name_map.get(self, "Regular")
+        return _FONT_WEIGHT_NAMES.get(self, "Regular")
+
+
+# Lookup tables for FontWeight.from_string()/to_string(). They live at module
+# level because dict attributes in an Enum body would become members.
+_FONT_WEIGHT_ALIASES = {
+    "thin": FontWeight.THIN,
+    "extralight": FontWeight.EXTRA_LIGHT,
+    "extra-light": FontWeight.EXTRA_LIGHT,
+    "ultralight": FontWeight.EXTRA_LIGHT,
+    "light": FontWeight.LIGHT,
+    "regular": FontWeight.REGULAR,
+    "normal": FontWeight.REGULAR,
+    "medium": FontWeight.MEDIUM,
+    "semibold": FontWeight.SEMI_BOLD,
+    "semi-bold": FontWeight.SEMI_BOLD,
+    "demibold": FontWeight.SEMI_BOLD,
+    "bold": FontWeight.BOLD,
+    "extrabold": FontWeight.EXTRA_BOLD,
+    "extra-bold": FontWeight.EXTRA_BOLD,
+    "ultrabold": FontWeight.EXTRA_BOLD,
+    "black": FontWeight.BLACK,
+    "heavy": FontWeight.BLACK,
+}
+_FONT_WEIGHT_NAMES = {
+    FontWeight.THIN: "Thin",
+    FontWeight.EXTRA_LIGHT: "ExtraLight",
+    FontWeight.LIGHT: "Light",
+    FontWeight.REGULAR: "Regular",
+    FontWeight.MEDIUM: "Medium",
+    FontWeight.SEMI_BOLD: "SemiBold",
+    FontWeight.BOLD: "Bold",
+    FontWeight.EXTRA_BOLD: "ExtraBold",
+    FontWeight.BLACK: "Black",
+}
 
 
 class FontStyle(Enum):
@@ -314,6 +319,12 @@ class NewTabPosition(Enum):
     END = "end"  # At end of tab bar
 
 
+@lru_cache(maxsize=1024)
+def _rgb_to_hex(r: int, g: int, b: int) -> str:
+    """Format RGB components as a hex string, memoized across Color instances."""
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
 @dataclass
 class Color:
     """
@@ -338,7 +349,7 @@ class Color:
 
     def to_hex(self) -> str:
         """Convert to hex color string (e.g., '#ff0000')."""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return _rgb_to_hex(self.r, self.g, self.b)
 
     @classmethod
     def from_hex(cls, hex_str: str) -> "Color":
@@ -346,13 +357,13 @@ class Color:
         hex_str = hex_str.lstrip("#")
         if len(hex_str) == 3:
             hex_str = "".join(c * 2 for c in hex_str)
-        if len(hex_str) != 6:
+        # int() also accepts signs, underscores, whitespace and non-ASCII
+        # digits, so only hand it plain ASCII letters and digits
+        if len(hex_str) != 6 or not (hex_str.isascii() and hex_str.isalnum()):
             raise ValueError(f"Invalid hex color: {hex_str}")
-        return cls(
-            r=int(hex_str[0:2], 16),
-            g=int(hex_str[2:4], 16),
-            b=int(hex_str[4:6], 16),
-        )
+        # Parse all three components with a single int() call
+        value = int(hex_str, 16)
+        return cls(r=value >> 16, g=value >> 8 & 0xFF, b=value & 0xFF)
 
     def to_dict(self) -> str:
         """Convert to hex string for serialization (iTerm2-Color-Schemes format)."""
@@ -1237,6 +1248,10 @@ class TabConfig:
     inactive_background: Color | None = None
     bar_background: Color | None = None
 
+    def is_empty(self) -> bool:
+        """Return True if no tab setting has been configured."""
+        return all(value is None for value in vars(self).values())
+
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
         result = {}
@@ -1337,6 +1352,10 @@ class PaneConfig:
     # Behavior
     focus_follows_mouse: bool | None = None
 
+    def is_empty(self) -> bool:
+        """Return True if no pane setting has been configured."""
+        return all(value is None for value in vars(self).values())
+
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
         result = {}
@@ -1711,9 +1730,13 @@ class CTEC:
             warnings=data.get("warnings", []),
         )
 
-    def add_warning(self, warning: str) -> None:
-        """Add a compatibility warning."""
-        self.warnings.append(warning)
+    def add_warning(self, warning: str, *args: object) -> None:
+        """Add a compatibility warning.
+
+        Any extra positional args are %-interpolated into the warning, so
+        callers don't need to format the message up front.
+        """
+        self.warnings.append(warning % args if args else warning)
 
     def add_terminal_specific(self, terminal: str, key: str, value: object) -> None:
         """Add a terminal-specific setting."""
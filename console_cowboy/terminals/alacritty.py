@@ -564,13 +564,14 @@ class AlacrittyAdapter(TerminalAdapter, CursorStyleMixin, ParsingMixin):
         return ctec
 
     @classmethod
-    def export(cls, ctec: CTEC, use_toml: bool = True) -> str:
+    def export(cls, ctec: CTEC, use_toml: bool = True, *, quiet: bool = False) -> str:
         """
         Export CTEC to Alacritty configuration format.
 
         Args:
             ctec: CTEC configuration to export
             use_toml: If True, export as TOML; otherwise export as YAML
+            quiet: Unused; Alacritty export prints nothing
 
         Returns:
             Configuration string in the specified format
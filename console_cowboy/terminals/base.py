@@ -96,12 +96,14 @@ class TerminalAdapter(ABC):
 
     @classmethod
     @abstractmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """
         Export CTEC configuration to the terminal's native format.
 
         Args:
             ctec: CTEC configuration to export
+            quiet: Suppress any notes the adapter would print to stderr.
+                Adapters that print nothing while exporting ignore it.
 
         Returns:
             String in the terminal's native configuration format
@@ -704,32 +704,16 @@ class GhosttyAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin, ParsingMi
         if quick_terminal.enabled:
             ctec.quick_terminal = quick_terminal
         # Add tabs if any tab settings were configured
-        if any(
-            getattr(tabs, f) is not None
-            for f in [
-                "visibility",
-                "position",
-                "new_tab_position",
-                "inherit_working_directory",
-            ]
-        ):
+        if not tabs.is_empty():
             ctec.tabs = tabs
         # Add panes if any pane settings were configured
-        if any(
-            getattr(panes, f) is not None
-            for f in [
-                "inactive_dim_factor",
-                "inactive_dim_color",
-                "divider_color",
-                "focus_follows_mouse",
-            ]
-        ):
+        if not panes.is_empty():
             ctec.panes = panes
 
         return ctec
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """Export CTEC to Ghostty configuration format."""
         lines = ["# Ghostty configuration", "# Generated by console-cowboy", ""]
 
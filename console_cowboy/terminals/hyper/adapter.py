@@ -432,7 +432,7 @@ class HyperAdapter(TerminalAdapter):
                 ctec.add_terminal_specific("hyper", key, config[key])
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """Export CTEC configuration to Hyper .hyper.js format."""
         config_items: list[str] = []
 
@@ -1015,7 +1015,7 @@ class ITerm2Adapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
         return result
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """
         Export CTEC to iTerm2 plist format.
 
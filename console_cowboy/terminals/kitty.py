@@ -528,35 +528,16 @@ class KittyAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
         if quick_terminal.enabled:
             ctec.quick_terminal = quick_terminal
         # Add tabs if any tab settings were configured
-        if any(
-            getattr(tabs, f) is not None
-            for f in [
-                "position",
-                "visibility",
-                "style",
-                "auto_hide_single",
-                "active_foreground",
-                "active_background",
-                "inactive_foreground",
-                "inactive_background",
-                "bar_background",
-            ]
-        ):
+        if not tabs.is_empty():
             ctec.tabs = tabs
         # Add panes if any pane settings were configured
-        if any(
-            getattr(panes, f) is not None
-            for f in [
-                "inactive_dim_factor",
-                "focus_follows_mouse",
-            ]
-        ):
+        if not panes.is_empty():
             ctec.panes = panes
 
         return ctec
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """Export CTEC to Kitty configuration format."""
         lines = ["# Kitty configuration", "# Generated by console-cowboy", ""]
 
@@ -418,7 +418,7 @@ class TerminalAppAdapter(TerminalAdapter):
         return scroll if has_scroll else None
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """
         Export CTEC configuration to Terminal.app .terminal format.
 
@@ -427,6 +427,7 @@ class TerminalAppAdapter(TerminalAdapter):
 
         Args:
             ctec: CTEC configuration to export
+            quiet: Unused; Terminal.app export prints nothing
 
         Returns:
             String in Terminal.app plist XML format
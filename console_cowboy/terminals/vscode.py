@@ -10,7 +10,12 @@ Terminal colors are stored inside the workbench.colorCustomizations object.
 """
 
 import json
+import operator
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import click
 
@@ -29,6 +34,18 @@ from .base import TerminalAdapter
 from .mixins import ColorMapMixin, CursorStyleMixin
 
 
+@dataclass(slots=True)
+class _ParseState:
+    """Sub-configs being filled in while parsing a settings.json."""
+
+    font: FontConfig = field(default_factory=FontConfig)
+    cursor: CursorConfig = field(default_factory=CursorConfig)
+    behavior: BehaviorConfig = field(default_factory=BehaviorConfig)
+    font_modified: bool = False
+    cursor_modified: bool = False
+    behavior_modified: bool = False
+
+
 class VSCodeAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
     """
     Adapter for Visual Studio Code integrated terminal.
@@ -52,38 +69,48 @@ class VSCodeAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
     ]
 
     # Cursor style mapping (VSCode uses 'line' for beam cursor)
-    CURSOR_STYLE_MAP = {
-        "block": CursorStyle.BLOCK,
-        "line": CursorStyle.BEAM,
-        "underline": CursorStyle.UNDERLINE,
-    }
+    CURSOR_STYLE_MAP = MappingProxyType(
+        {
+            "block": CursorStyle.BLOCK,
+            "line": CursorStyle.BEAM,
+            "underline": CursorStyle.UNDERLINE,
+        }
+    )
 
     # Color key mapping from VSCode (inside workbench.colorCustomizations) to CTEC
-    COLOR_KEY_MAP = {
-        "terminal.foreground": "foreground",
-        "terminal.background": "background",
-        "terminal.selectionBackground": "selection",
-        "terminal.selectionForeground": "selection_text",
-        "terminalCursor.foreground": "cursor",
-        "terminalCursor.background": "cursor_text",
-        # ANSI colors
-        "terminal.ansiBlack": "black",
-        "terminal.ansiRed": "red",
-        "terminal.ansiGreen": "green",
-        "terminal.ansiYellow": "yellow",
-        "terminal.ansiBlue": "blue",
-        "terminal.ansiMagenta": "magenta",
-        "terminal.ansiCyan": "cyan",
-        "terminal.ansiWhite": "white",
-        "terminal.ansiBrightBlack": "bright_black",
-        "terminal.ansiBrightRed": "bright_red",
-        "terminal.ansiBrightGreen": "bright_green",
-        "terminal.ansiBrightYellow": "bright_yellow",
-        "terminal.ansiBrightBlue": "bright_blue",
-        "terminal.ansiBrightMagenta": "bright_magenta",
-        "terminal.ansiBrightCyan": "bright_cyan",
-        "terminal.ansiBrightWhite": "bright_white",
-    }
+    COLOR_KEY_MAP = MappingProxyType(
+        {
+            "terminal.foreground": "foreground",
+            "terminal.background": "background",
+            "terminal.selectionBackground": "selection",
+            "terminal.selectionForeground": "selection_text",
+            "terminalCursor.foreground": "cursor",
+            "terminalCursor.background": "cursor_text",
+            # ANSI colors
+            "terminal.ansiBlack": "black",
+            "terminal.ansiRed": "red",
+            "terminal.ansiGreen": "green",
+            "terminal.ansiYellow": "yellow",
+            "terminal.ansiBlue": "blue",
+            "terminal.ansiMagenta": "magenta",
+            "terminal.ansiCyan": "cyan",
+            "terminal.ansiWhite": "white",
+            "terminal.ansiBrightBlack": "bright_black",
+            "terminal.ansiBrightRed": "bright_red",
+            "terminal.ansiBrightGreen": "bright_green",
+            "terminal.ansiBrightYellow": "bright_yellow",
+            "terminal.ansiBrightBlue": "bright_blue",
+            "terminal.ansiBrightMagenta": "bright_magenta",
+            "terminal.ansiBrightCyan": "bright_cyan",
+            "terminal.ansiBrightWhite": "bright_white",
+        }
+    )
+
+    # (getter, vscode_key) pairs used by export, built once at class definition
+    _COLOR_EXPORT = tuple(
+        (operator.attrgetter(ctec_key), vscode_key)
+        for vscode_key, ctec_key in COLOR_KEY_MAP.items()
+    )
 
     @classmethod
     def can_parse(cls, content: str) -> bool:
@@ -100,22 +127,6 @@ class VSCodeAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
                 return True
         return False
 
-    # Keys we explicitly handle (not stored as terminal_specific)
-    _RECOGNIZED_KEYS = {
-        "terminal.integrated.fontFamily",
-        "terminal.integrated.fontSize",
-        "terminal.integrated.fontWeight",
-        "terminal.integrated.lineHeight",
-        "terminal.integrated.letterSpacing",
-        "terminal.integrated.fontLigatures",
-        "terminal.integrated.cursorStyle",
-        "terminal.integrated.cursorBlinking",
-        "terminal.integrated.scrollback",
-        "terminal.integrated.copyOnSelection",
-        "terminal.integrated.confirmOnExit",
-        "workbench.colorCustomizations",
-    }
-
     @classmethod
     def _parse_font_weight(cls, value: str | int) -> FontWeight | None:
         """Convert VSCode font weight to CTEC FontWeight."""
@@ -131,222 +142,254 @@ class VSCodeAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
             return None
 
     @classmethod
-    def parse(
+    def _get_key_parsers(
         cls,
-        source: str | Path,
-        *,
-        content: str | None = None,
-    ) -> CTEC:
-        """Parse VSCode settings.json containing terminal configuration."""
-        ctec = CTEC(source_terminal="vscode")
+    ) -> MappingProxyType[str, Callable[[_ParseState, Any, CTEC], None]]:
+        """Lazy load the settings key -> parser dispatch table."""
+        if "_key_parsers_cache" not in cls.__dict__:
+            parsers = {
+                "terminal.integrated.fontFamily": cls._parse_font_family,
+                "terminal.integrated.fontSize": cls._parse_font_size,
+                "terminal.integrated.fontWeight": cls._parse_font_weight_key,
+                "terminal.integrated.lineHeight": cls._parse_line_height,
+                "terminal.integrated.letterSpacing": cls._parse_letter_spacing,
+                "terminal.integrated.fontLigatures": cls._parse_font_ligatures,
+                "terminal.integrated.cursorStyle": cls._parse_cursor_style,
+                "terminal.integrated.cursorBlinking": cls._parse_cursor_blinking,
+                "terminal.integrated.scrollback": cls._parse_scrollback,
+                "terminal.integrated.copyOnSelection": cls._parse_copy_on_selection,
+                "terminal.integrated.confirmOnExit": cls._parse_confirm_on_exit,
+                "workbench.colorCustomizations": cls._parse_color_customizations,
+            }
+            cls._key_parsers_cache = MappingProxyType(parsers)
+        return cls._key_parsers_cache
 
-        # Load JSON content
-        if content is None:
-            path = Path(source)
-            if not path.exists():
-                raise FileNotFoundError(f"Config file not found: {path}")
-            content = path.read_text()
+    @classmethod
+    def _parse_font_family(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        state.font.family = value
+        state.font_modified = True
 
+    @classmethod
+    def _parse_font_size(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON: {e}") from e
-
-        # Parse font settings
-        font = FontConfig()
-        font_modified = False
+            state.font.size = float(value)
+            state.font_modified = True
+        except (ValueError, TypeError):
+            ctec.add_warning("Invalid fontSize: %s", value)
 
-        if "terminal.integrated.fontFamily" in data:
-            font.family = data["terminal.integrated.fontFamily"]
-            font_modified = True
-
-        if "terminal.integrated.fontSize" in data:
-            try:
-                font.size = float(data["terminal.integrated.fontSize"])
-                font_modified = True
-            except (ValueError, TypeError):
-                ctec.add_warning(
-                    f"Invalid fontSize: {data['terminal.integrated.fontSize']}"
-                )
+    @classmethod
+    def _parse_font_weight_key(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        weight = cls._parse_font_weight(value)
+        if weight:
+            state.font.weight = weight
+            state.font_modified = True
+        else:
+            ctec.add_warning("Invalid fontWeight: %s", value)
 
-        if "terminal.integrated.fontWeight" in data:
-            weight = cls._parse_font_weight(data["terminal.integrated.fontWeight"])
-            if weight:
-                font.weight = weight
-                font_modified = True
-            else:
-                ctec.add_warning(
-                    f"Invalid fontWeight: {data['terminal.integrated.fontWeight']}"
-                )
+    @classmethod
+    def _parse_line_height(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        try:
+            state.font.line_height = float(value)
+            state.font_modified = True
+        except (ValueError, TypeError):
+            ctec.add_warning("Invalid lineHeight: %s", value)
 
-        if "terminal.integrated.lineHeight" in data:
-            try:
-                font.line_height = float(data["terminal.integrated.lineHeight"])
-                font_modified = True
-            except (ValueError, TypeError):
-                ctec.add_warning(
-                    f"Invalid lineHeight: {data['terminal.integrated.lineHeight']}"
-                )
+    @classmethod
+    def _parse_letter_spacing(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        try:
+            # letterSpacing is in pixels, convert to cell_width multiplier
+            # Approximate: +1px spacing ~ +0.1 cell_width
+            spacing = float(value)
+            state.font.cell_width = 1.0 + (spacing / 10.0)
+            state.font_modified = True
+        except (ValueError, TypeError):
+            ctec.add_warning("Invalid letterSpacing: %s", value)
 
-        if "terminal.integrated.letterSpacing" in data:
-            try:
-                # letterSpacing is in pixels, convert to cell_width multiplier
-                # Approximate: +1px spacing ~ +0.1 cell_width
-                spacing = float(data["terminal.integrated.letterSpacing"])
-                font.cell_width = 1.0 + (spacing / 10.0)
-                font_modified = True
-            except (ValueError, TypeError):
-                ctec.add_warning(
-                    f"Invalid letterSpacing: {data['terminal.integrated.letterSpacing']}"
-                )
+    @classmethod
+    def _parse_font_ligatures(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        # Can be boolean or CSS font-feature-settings string
+        if isinstance(value, bool):
+            state.font.ligatures = value
+        else:
+            # String means enabled with specific features
+            state.font.ligatures = True
+            ctec.add_terminal_specific(
+                "vscode", "terminal.integrated.fontLigatures", value
+            )
+        state.font_modified = True
 
-        if "terminal.integrated.fontLigatures" in data:
-            ligatures_val = data["terminal.integrated.fontLigatures"]
-            # Can be boolean or CSS font-feature-settings string
-            if isinstance(ligatures_val, bool):
-                font.ligatures = ligatures_val
-            else:
-                # String means enabled with specific features
-                font.ligatures = True
-                ctec.add_terminal_specific(
-                    "vscode", "terminal.integrated.fontLigatures", ligatures_val
-                )
-            font_modified = True
+    @classmethod
+    def _parse_cursor_style(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        state.cursor.style = cls.get_cursor_style(value)
+        state.cursor_modified = True
 
-        if font_modified:
-            ctec.font = font
+    @classmethod
+    def _parse_cursor_blinking(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        state.cursor.blink = bool(value)
+        state.cursor_modified = True
 
-        # Parse cursor settings
-        cursor = CursorConfig()
-        cursor_modified = False
+    @classmethod
+    def _parse_color_customizations(
+        cls, state: _ParseState, value: Any, ctec: CTEC
+    ) -> None:
+        if not isinstance(value, dict):
+            return
+        scheme = ColorScheme()
 
-        if "terminal.integrated.cursorStyle" in data:
-            style_str = data["terminal.integrated.cursorStyle"]
-            cursor.style = cls.get_cursor_style(style_str)
-            cursor_modified = True
+        def on_error(key, val, exc):
+            ctec.add_warning("Invalid color for %s", key)
 
-        if "terminal.integrated.cursorBlinking" in data:
-            cursor.blink = bool(data["terminal.integrated.cursorBlinking"])
-            cursor_modified = True
+        if cls.map_colors_to_ctec(value, scheme, on_error=on_error):
+            ctec.color_scheme = scheme
 
-        if cursor_modified:
-            ctec.cursor = cursor
+    @classmethod
+    def _parse_scrollback(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        try:
+            ctec.scroll = ScrollConfig.from_lines(int(value))
+        except (ValueError, TypeError):
+            ctec.add_warning("Invalid scrollback: %s", value)
 
-        # Parse colors from workbench.colorCustomizations
-        if "workbench.colorCustomizations" in data:
-            color_customs = data["workbench.colorCustomizations"]
-            if isinstance(color_customs, dict):
-                scheme = ColorScheme()
+    @classmethod
+    def _parse_copy_on_selection(
+        cls, state: _ParseState, value: Any, ctec: CTEC
+    ) -> None:
+        state.behavior.copy_on_select = bool(value)
+        state.behavior_modified = True
 
-                def on_error(key, val, exc):
-                    ctec.add_warning(f"Invalid color for {key}")
+    @classmethod
+    def _parse_confirm_on_exit(cls, state: _ParseState, value: Any, ctec: CTEC) -> None:
+        # VSCode uses "never", "always", "hasChildProcesses"
+        state.behavior.confirm_close = value != "never"
+        state.behavior_modified = True
 
-                if cls.map_colors_to_ctec(color_customs, scheme, on_error=on_error):
-                    ctec.color_scheme = scheme
+    @classmethod
+    def parse(
+        cls,
+        source: str | Path,
+        *,
+        content: str | None = None,
+    ) -> CTEC:
+        """Parse VSCode settings.json containing terminal configuration."""
+        ctec = CTEC(source_terminal="vscode")
 
-        # Parse scroll settings
-        if "terminal.integrated.scrollback" in data:
+        # Load JSON content. Files are handed to json.loads as raw bytes so
+        # the whole settings.json isn't decoded into an intermediate str.
+        raw: str | bytes
+        if content is None:
+            path = Path(source)
             try:
-                lines = int(data["terminal.integrated.scrollback"])
-                ctec.scroll = ScrollConfig.from_lines(lines)
-            except (ValueError, TypeError):
-                ctec.add_warning(
-                    f"Invalid scrollback: {data['terminal.integrated.scrollback']}"
-                )
-
-        # Parse behavior settings
-        behavior = BehaviorConfig()
-        behavior_modified = False
-
-        if "terminal.integrated.copyOnSelection" in data:
-            behavior.copy_on_select = bool(data["terminal.integrated.copyOnSelection"])
-            behavior_modified = True
+                raw = path.read_bytes()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Config file not found: {path}") from None
+        else:
+            raw = content
 
-        if "terminal.integrated.confirmOnExit" in data:
-            confirm_val = data["terminal.integrated.confirmOnExit"]
-            # VSCode uses "never", "always", "hasChildProcesses"
-            behavior.confirm_close = confirm_val != "never"
-            behavior_modified = True
-
-        if behavior_modified:
-            ctec.behavior = behavior
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON: {e}") from e
 
-        # Store VSCode-specific settings that have no CTEC equivalent
-        for key in data:
-            if (
-                key.startswith("terminal.integrated.")
-                and key not in cls._RECOGNIZED_KEYS
-            ):
-                ctec.add_terminal_specific("vscode", key, data[key])
+        state = _ParseState()
+        parsers = cls._get_key_parsers()
+
+        # Classify every top-level key in a single pass. Unrecognized
+        # terminal.integrated.* keys have no CTEC equivalent and are kept
+        # as VSCode-specific settings.
+        for key, value in data.items():
+            parser = parsers.get(key)
+            if parser is not None:
+                parser(state, value, ctec)
+            elif key.startswith("terminal.integrated."):
+                ctec.add_terminal_specific("vscode", key, value)
+
+        if state.font_modified:
+            ctec.font = state.font
+        if state.cursor_modified:
+            ctec.cursor = state.cursor
+        if state.behavior_modified:
+            ctec.behavior = state.behavior
 
         return ctec
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
-        """
-        Export CTEC to VSCode settings.json format.
-
-        Returns a JSON object containing only terminal-related settings.
-        Users should merge this into their existing settings.json.
-
-        Note: Colors are exported inside workbench.colorCustomizations.
-        """
-        result = {}
+    def _build_result(cls, ctec: CTEC) -> dict[str, Any]:
+        """Build the settings.json dict for a CTEC configuration."""
+        # Collect (key, value) pairs and build the dict once at the end
+        items: list[tuple[str, Any]] = []
 
         # Export font settings
         if ctec.font:
             if ctec.font.family:
-                result["terminal.integrated.fontFamily"] = ctec.font.family
+                items.append(("terminal.integrated.fontFamily", ctec.font.family))
             if ctec.font.size:
-                result["terminal.integrated.fontSize"] = ctec.font.size
+                items.append(("terminal.integrated.fontSize", ctec.font.size))
             if ctec.font.weight:
-                result["terminal.integrated.fontWeight"] = ctec.font.weight.value
+                items.append(("terminal.integrated.fontWeight", ctec.font.weight.value))
             if ctec.font.line_height:
-                result["terminal.integrated.lineHeight"] = ctec.font.line_height
+                items.append(("terminal.integrated.lineHeight", ctec.font.line_height))
             if ctec.font.cell_width and ctec.font.cell_width != 1.0:
                 # Convert cell_width back to letterSpacing (approximate)
                 spacing = int((ctec.font.cell_width - 1.0) * 10)
-                result["terminal.integrated.letterSpacing"] = spacing
+                items.append(("terminal.integrated.letterSpacing", spacing))
             if ctec.font.ligatures is not None:
-                result["terminal.integrated.fontLigatures"] = ctec.font.ligatures
+                items.append(("terminal.integrated.fontLigatures", ctec.font.ligatures))
 
         # Export cursor settings
         if ctec.cursor:
             if ctec.cursor.style:
-                result["terminal.integrated.cursorStyle"] = cls.get_cursor_style_value(
-                    ctec.cursor.style, "block"
+                items.append(
+                    (
+                        "terminal.integrated.cursorStyle",
+                        cls.get_cursor_style_value(ctec.cursor.style, "block"),
+                    )
                 )
             if ctec.cursor.blink is not None:
-                result["terminal.integrated.cursorBlinking"] = ctec.cursor.blink
+                items.append(("terminal.integrated.cursorBlinking", ctec.cursor.blink))
 
         # Export colors inside workbench.colorCustomizations
         if ctec.color_scheme:
-            color_customs = cls.map_ctec_to_colors(ctec.color_scheme)
+            scheme = ctec.color_scheme
+            color_customs = {}
+            for getter, vscode_key in cls._COLOR_EXPORT:
+                color = getter(scheme)
+                if color:
+                    color_customs[vscode_key] = color.to_hex()
 
             if color_customs:
-                result["workbench.colorCustomizations"] = color_customs
+                items.append(("workbench.colorCustomizations", color_customs))
 
         # Export scroll settings
         if ctec.scroll:
             lines = ctec.scroll.get_effective_lines(default=1000, max_lines=100000)
-            result["terminal.integrated.scrollback"] = lines
+            items.append(("terminal.integrated.scrollback", lines))
 
         # Export behavior settings
         if ctec.behavior:
             if ctec.behavior.copy_on_select is not None:
-                result["terminal.integrated.copyOnSelection"] = (
-                    ctec.behavior.copy_on_select
+                items.append(
+                    (
+                        "terminal.integrated.copyOnSelection",
+                        ctec.behavior.copy_on_select,
+                    )
                 )
             if ctec.behavior.confirm_close is not None:
-                result["terminal.integrated.confirmOnExit"] = (
-                    "always" if ctec.behavior.confirm_close else "never"
+                items.append(
+                    (
+                        "terminal.integrated.confirmOnExit",
+                        "always" if ctec.behavior.confirm_close else "never",
+                    )
                 )
 
         # Restore VSCode-specific settings
         for setting in ctec.get_terminal_specific("vscode"):
-            result[setting.key] = setting.value
+            items.append((setting.key, setting.value))
+
+        # Later entries win on duplicate keys, matching dict assignment
+        return dict(items)
 
-        # Print informational message to stderr
+    @classmethod
+    def _echo_export_notes(cls) -> None:
+        """Print merge instructions for the exported settings to stderr."""
         click.echo(
             click.style("\nVSCode Export Notes:", fg="cyan", bold=True),
             err=True,
@@ -366,4 +409,22 @@ class VSCodeAdapter(TerminalAdapter, CursorStyleMixin, ColorMapMixin):
             err=True,
         )
 
+    @classmethod
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
+        """
+        Export CTEC to VSCode settings.json format.
+
+        Returns a JSON object containing only terminal-related settings.
+        Users should merge this into their existing settings.json.
+
+        Note: Colors are exported inside workbench.colorCustomizations.
+
+        Args:
+            ctec: CTEC configuration to export
+            quiet: Skip the merge instructions printed to stderr (useful
+                for batch exports)
+        """
+        result = cls._build_result(ctec)
+        if not quiet:
+            cls._echo_export_notes()
         return json.dumps(result, indent=2)
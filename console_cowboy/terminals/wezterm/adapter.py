@@ -8,7 +8,14 @@ This adapter uses a Lua interpreter with a mock wezterm module to
 accurately parse WezTerm configurations.
 """
 
+import dataclasses
+import io
+import re
+import sys
+from collections.abc import Callable, Iterable
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import ClassVar
 
 from console_cowboy.ctec.schema import (
     CTEC,
@@ -34,7 +41,6 @@ from console_cowboy.ctec.schema import (
     TextHintRule,
     WindowConfig,
 )
-from console_cowboy.utils.colors import normalize_color
 from console_cowboy.utils.fonts import is_postscript_name, postscript_to_friendly
 
 from ..base import TerminalAdapter
@@ -44,7 +50,7 @@ from .lua import ActionSpec, EventCallback, FontSpec, execute_wezterm_config
 # Format: action_name -> (param_name, is_table)
 # is_table=True means the param should be wrapped as { param_name = value }
 # is_table=False means it's a simple function call action(value)
-ACTION_PARAM_FORMATS = {
+ACTION_PARAM_FORMATS: dict[str, tuple[str | None, bool]] = {
     # Clipboard actions - simple string parameter
     "CopyTo": ("destination", False),
     "PasteFrom": ("source", False),
@@ -88,6 +94,220 @@ ACTION_PARAM_FORMATS = {
     "Multiple": ("actions", False),
 }
 
+# Pre-rendered Lua for each known action; "{param}" is filled in by str.format
+ACTION_TEMPLATES: dict[str, str] = {
+    action: (
+        # No parameter needed
+        f"wezterm.action.{action}"
+        if param_name is None
+        # Table parameter: action { param_name = value }
+        else f'wezterm.action.{action} {{{{ {param_name} = "{{param}}" }}}}'
+        if is_table
+        # Simple function call: action(value)
+        else f'wezterm.action.{action}("{{param}}")'
+    )
+    for action, (param_name, is_table) in ACTION_PARAM_FORMATS.items()
+}
+
+# Multiplexer domain settings preserved verbatim for round-trip
+DOMAIN_TYPES = (
+    "ssh_domains",
+    "unix_domains",
+    "tls_clients",
+    "tls_servers",
+    "exec_domains",
+)
+
+# Terminal-specific keys that export() restores in their own sections
+HANDLED_SETTING_KEYS = frozenset(
+    {
+        "leader",
+        "key_tables",
+        "font_harfbuzz_features",
+        "font_freetype_load_target",
+        "event_callbacks",
+        "window_frame",
+        *DOMAIN_TYPES,
+    }
+)
+
+# HarfBuzz features that turn ligatures off
+LIGATURES_OFF_FEATURES = ("liga=0", "clig=0", "calt=0")
+
+# Top-level keys read by the tab and pane sections of parse()
+TAB_KEYS = frozenset(
+    {
+        "enable_tab_bar",
+        "tab_bar_at_bottom",
+        "use_fancy_tab_bar",
+        "hide_tab_bar_if_only_one_tab",
+        "tab_max_width",
+        "show_tab_index_in_tab_bar",
+    }
+)
+PANE_KEYS = frozenset({"inactive_pane_hsb", "pane_focus_follows_mouse"})
+
+# Builds TerminalSpecificSetting entries owned by this adapter
+_wezterm_setting = partial(TerminalSpecificSetting, terminal="wezterm")
+
+# Hyperlink rule formats that point at a URL
+_URL_HINT_RE = re.compile("http|mailto", re.IGNORECASE)
+
+
+def _to_int(value: object) -> int | None:
+    """
+    Coerce a config scalar to int, returning None if absent or invalid.
+
+    Lua integers already arrive as int, so the common case is a type check.
+    """
+    if value is None or type(value) is int:
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_float(value: object) -> float | None:
+    """Coerce a config scalar to float, returning None if absent or invalid."""
+    if value is None or type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Interned boolean tokens, compared by identity against _lua_token() results
+_TRUE = sys.intern("true")
+_FALSE = sys.intern("false")
+
+# Lua literal for a Python bool, indexed by the bool itself
+_LUA_BOOL = (_FALSE, _TRUE)
+
+
+def _lua_token(value: object) -> str:
+    """Normalize a scalar config value to an interned, unquoted, lowercase token."""
+    text = value if isinstance(value, str) else str(value)
+    return sys.intern(text.strip("'\"").lower())
+
+
+def _lua_string_list(values: Iterable[object]) -> str:
+    """Render values as the comma-separated, double-quoted items of a Lua table."""
+    return ", ".join(map('"{}"'.format, values))
+
+
+@lru_cache(maxsize=256)
+def _parse_color_components(color_str: str) -> tuple[int, int, int] | None:
+    """Parse a Lua color string into RGB components, memoized across calls."""
+    color_str = color_str.strip().strip("'\"")
+    if color_str.lower() == "none":
+        return None
+    # Lua colors are always strings, so go straight to the hex parser
+    # rather than through normalize_color's type dispatch
+    try:
+        color = Color.from_hex(color_str)
+    except ValueError:
+        return None
+    return (color.r, color.g, color.b)
+
+
+def _parse_color_string(color_str: str) -> Color | None:
+    """
+    Parse a Lua color string.
+
+    Configs repeat the same few colors across the palette, tab bar and
+    split settings, so the parsed components are cached; each call still
+    returns its own Color since Color is mutable.
+    """
+    components = _parse_color_components(color_str)
+    if components is None:
+        return None
+    return Color(*components)
+
+
+# Substrings that identify a Wezterm Lua config, matched in a single pass
+WEZTERM_MARKERS = (
+    "local wezterm",
+    "require 'wezterm'",
+    'require "wezterm"',
+    "require('wezterm')",
+    'require("wezterm")',
+    "wezterm.config_builder",
+    "config.font",
+    "config.colors",
+    "config.font_size",
+    "wezterm.font",
+    "wezterm.font_with_fallback",
+)
+_MARKER_RE = re.compile("|".join(map(re.escape, WEZTERM_MARKERS)))
+
+# Fixed blocks emitted verbatim by export()
+EXPORT_PREAMBLE = (
+    "-- Wezterm configuration\n"
+    "-- Generated by console-cowboy\n"
+    "\n"
+    "local wezterm = require 'wezterm'\n"
+    "local config = wezterm.config_builder()\n"
+    "\n"
+)
+
+VISUAL_BELL_BLOCK = (
+    'config.audible_bell = "Disabled"\n'
+    "config.visual_bell = {\n"
+    '  fade_in_function = "EaseIn",\n'
+    "  fade_in_duration_ms = 50,\n"
+    '  fade_out_function = "EaseOut",\n'
+    "  fade_out_duration_ms = 50,\n"
+    "}\n"
+)
+
+# ColorScheme color fields, i.e. everything but the scheme metadata
+COLOR_SCHEME_COLOR_FIELDS = tuple(
+    f.name
+    for f in dataclasses.fields(ColorScheme)
+    if f.name not in ("name", "author", "variant")
+)
+
+# Simple colors-table keys -> ColorScheme attributes, in export order
+COLOR_KEY_MAP = {
+    "foreground": "foreground",
+    "background": "background",
+    "cursor_bg": "cursor",
+    "cursor_fg": "cursor_text",
+    "selection_bg": "selection",
+    "selection_fg": "selection_text",
+}
+
+# Palette array keys -> ColorScheme attributes, in palette order
+_ANSI_NAMES = ("black", "red", "green", "yellow", "blue", "magenta", "cyan", "white")
+PALETTE_NAMES = {
+    "ansi": _ANSI_NAMES,
+    "brights": tuple(f"bright_{name}" for name in _ANSI_NAMES),
+}
+
+# TabConfig colors exported under config.colors.tab_bar
+TAB_COLOR_FIELDS = (
+    "active_foreground",
+    "active_background",
+    "inactive_foreground",
+    "inactive_background",
+    "bar_background",
+)
+
+# Escapes applied to hyperlink regexes written inside Lua [[ ]] strings
+_LUA_REGEX_ESCAPES = str.maketrans({"\\": "\\\\"})
+
+# Text hint actions that can be expressed as hyperlink_rules
+HYPERLINK_ACTIONS = frozenset(
+    {
+        TextHintAction.OPEN,
+        TextHintAction.OPEN_URL,
+        TextHintAction.OPEN_FILE,
+        None,
+    }
+)
+
 
 class WeztermAdapter(TerminalAdapter):
     """
@@ -106,111 +326,223 @@ class WeztermAdapter(TerminalAdapter):
         ".config/wezterm/wezterm.lua",
     ]
 
-    CURSOR_STYLE_MAP = {
-        "SteadyBlock": CursorStyle.BLOCK,
-        "BlinkingBlock": CursorStyle.BLOCK,
-        "SteadyBar": CursorStyle.BEAM,
-        "BlinkingBar": CursorStyle.BEAM,
-        "SteadyUnderline": CursorStyle.UNDERLINE,
-        "BlinkingUnderline": CursorStyle.UNDERLINE,
+    # default_cursor_style -> (style, blink)
+    CURSOR_STYLE_MAP: ClassVar[dict[str, tuple[CursorStyle, bool]]] = {
+        "SteadyBlock": (CursorStyle.BLOCK, False),
+        "BlinkingBlock": (CursorStyle.BLOCK, True),
+        "SteadyBar": (CursorStyle.BEAM, False),
+        "BlinkingBar": (CursorStyle.BEAM, True),
+        "SteadyUnderline": (CursorStyle.UNDERLINE, False),
+        "BlinkingUnderline": (CursorStyle.UNDERLINE, True),
+    }
+    # (style, blink) -> default_cursor_style, for export
+    CURSOR_STYLE_EXPORT_MAP: ClassVar[dict[tuple[CursorStyle, bool], str]] = {
+        entry: name for name, entry in CURSOR_STYLE_MAP.items()
     }
 
     @classmethod
     def can_parse(cls, content: str) -> bool:
         """Check if content looks like a Wezterm Lua config."""
         # Wezterm uses Lua with specific patterns
-        wezterm_markers = [
-            "local wezterm",
-            "require 'wezterm'",
-            'require "wezterm"',
-            "require('wezterm')",
-            'require("wezterm")',
-            "wezterm.config_builder",
-            "config.font",
-            "config.colors",
-            "config.font_size",
-            "wezterm.font",
-            "wezterm.font_with_fallback",
-        ]
-        for marker in wezterm_markers:
-            if marker in content:
-                return True
-        return False
+        return _MARKER_RE.search(content) is not None
 
     @classmethod
     def _parse_lua_color(cls, color_str: str) -> Color | None:
         """Parse a color from Lua format."""
         if color_str is None:
             return None
-        color_str = str(color_str).strip().strip("'\"")
-        if color_str.lower() == "none":
-            return None
-        try:
-            return normalize_color(color_str)
-        except ValueError:
+        if not isinstance(color_str, str):
+            color_str = str(color_str)
+        return _parse_color_string(color_str)
+
+    @staticmethod
+    def _get_number(
+        config: dict,
+        key: str,
+        convert: Callable[[object], int | float | None],
+        ctec: CTEC | None = None,
+    ) -> int | float | None:
+        """
+        Read a numeric scalar from the evaluated config via _to_int/_to_float.
+
+        Invalid values yield None, with a warning when ``ctec`` is given.
+        """
+        value = config.get(key)
+        number = convert(value)
+        if number is None and value is not None and ctec is not None:
+            ctec.add_warning(f"Invalid {key}: {value}")
+        return number
+
+    @staticmethod
+    def _lua_array_values(table: dict) -> list:
+        """Return the values of a Lua table's integer keys, in key order."""
+        return [table[k] for k in sorted(k for k in table if isinstance(k, int))]
+
+    @staticmethod
+    def _get_string(config: dict, key: str) -> str | None:
+        """Read a string scalar from the evaluated config, trimmed of quotes."""
+        value = config.get(key)
+        if value is None:
             return None
+        return str(value).strip().strip("'\"")
 
     @classmethod
     def _parse_colors_dict(cls, colors: dict) -> ColorScheme:
         """Parse a colors dict into a ColorScheme."""
         scheme = ColorScheme()
 
-        # Parse simple color assignments
-        color_mappings = {
-            "foreground": "foreground",
-            "background": "background",
-            "cursor_fg": "cursor_text",
-            "cursor_bg": "cursor",
-            "selection_fg": "selection_text",
-            "selection_bg": "selection",
-        }
-
-        for wez_key, ctec_key in color_mappings.items():
-            if wez_key in colors:
-                color = cls._parse_lua_color(colors[wez_key])
+        # Single pass over the table, dispatching each key by name
+        for wez_key, value in colors.items():
+            ctec_key = COLOR_KEY_MAP.get(wez_key)
+            if ctec_key is not None:
+                color = cls._parse_lua_color(value)
                 if color:
                     setattr(scheme, ctec_key, color)
+                continue
 
-        # Parse ANSI colors array
-        if "ansi" in colors:
-            ansi_colors = colors["ansi"]
-            if isinstance(ansi_colors, (list, tuple)):
-                ansi_names = [
-                    "black",
-                    "red",
-                    "green",
-                    "yellow",
-                    "blue",
-                    "magenta",
-                    "cyan",
-                    "white",
-                ]
-                for name, color_str in zip(ansi_names, ansi_colors, strict=False):
-                    color = cls._parse_lua_color(color_str)
-                    if color:
-                        setattr(scheme, name, color)
-
-        # Parse bright colors array
-        if "brights" in colors:
-            bright_colors = colors["brights"]
-            if isinstance(bright_colors, (list, tuple)):
-                bright_names = [
-                    "bright_black",
-                    "bright_red",
-                    "bright_green",
-                    "bright_yellow",
-                    "bright_blue",
-                    "bright_magenta",
-                    "bright_cyan",
-                    "bright_white",
-                ]
-                for name, color_str in zip(bright_names, bright_colors, strict=False):
+            palette_names = PALETTE_NAMES.get(wez_key)
+            if palette_names is not None and isinstance(value, (list, tuple)):
+                for name, color_str in zip(palette_names, value, strict=False):
                     color = cls._parse_lua_color(color_str)
                     if color:
                         setattr(scheme, name, color)
 
         return scheme
 
+    @classmethod
+    def _parse_key_binding(cls, binding: object) -> KeyBinding | None:
+        """Parse a single entry of config.keys into a KeyBinding."""
+        if not isinstance(binding, dict):
+            return None
+        key = binding.get("key")
+        action = binding.get("action")
+        if not key or not action:
+            return None
+
+        # Parse action
+        if isinstance(action, ActionSpec):
+            action_name = action.name
+            # Table arguments are kept as their string form
+            action_param = str(action.args[0]) if action.args else None
+        elif isinstance(action, str):
+            action_name = action
+            action_param = None
+        else:
+            return None
+        if not action_name:
+            return None
+
+        # Parse modifiers, splitting out LEADER
+        mods = binding.get("mods", "")
+        mod_list = [m.strip() for m in str(mods).split("|")] if mods else []
+        has_leader = "LEADER" in mod_list
+        if has_leader:
+            mod_list = [m for m in mod_list if m != "LEADER"]
+
+        kb = KeyBinding(
+            action=action_name,
+            key=str(key),
+            mods=mod_list,
+            action_param=action_param,
+        )
+        # Store leader info in key_sequence for conceptual mapping
+        if has_leader:
+            kb.key_sequence = ["LEADER"]
+        return kb
+
+    @classmethod
+    def _parse_tabs(cls, config: dict, colors: dict | None) -> TabConfig:
+        """Parse tab bar settings, including colors.tab_bar."""
+        tabs = TabConfig()
+        enable_tab_bar = config.get("enable_tab_bar")
+        if enable_tab_bar is not None:
+            if isinstance(enable_tab_bar, bool) and not enable_tab_bar:
+                tabs.visibility = TabBarVisibility.NEVER
+            elif _lua_token(enable_tab_bar) is _FALSE:
+                tabs.visibility = TabBarVisibility.NEVER
+
+        tab_bar_at_bottom = config.get("tab_bar_at_bottom")
+        if tab_bar_at_bottom is not None:
+            if isinstance(tab_bar_at_bottom, bool):
+                tabs.position = (
+                    TabBarPosition.BOTTOM if tab_bar_at_bottom else TabBarPosition.TOP
+                )
+            elif _lua_token(tab_bar_at_bottom) is _TRUE:
+                tabs.position = TabBarPosition.BOTTOM
+            else:
+                tabs.position = TabBarPosition.TOP
+
+        use_fancy = config.get("use_fancy_tab_bar")
+        if use_fancy is not None:
+            if isinstance(use_fancy, bool):
+                tabs.style = TabBarStyle.FANCY if use_fancy else TabBarStyle.NATIVE
+            elif _lua_token(use_fancy) is _TRUE:
+                tabs.style = TabBarStyle.FANCY
+            else:
+                tabs.style = TabBarStyle.NATIVE
+
+        hide_single = config.get("hide_tab_bar_if_only_one_tab")
+        if hide_single is not None:
+            if isinstance(hide_single, bool):
+                tabs.auto_hide_single = hide_single
+            elif _lua_token(hide_single) is _TRUE:
+                tabs.auto_hide_single = True
+
+        tabs.max_width = cls._get_number(config, "tab_max_width", _to_int)
+
+        show_index = config.get("show_tab_index_in_tab_bar")
+        if show_index is not None:
+            if isinstance(show_index, bool):
+                tabs.show_index = show_index
+            elif _lua_token(show_index) is _TRUE:
+                tabs.show_index = True
+
+        # Parse tab colors from colors.tab_bar
+        # (_parse_lua_color maps a missing key to None, the field default)
+        tab_bar = colors.get("tab_bar") if colors else None
+        if isinstance(tab_bar, dict):
+            tabs.bar_background = cls._parse_lua_color(tab_bar.get("background"))
+            active_tab = tab_bar.get("active_tab")
+            if isinstance(active_tab, dict):
+                tabs.active_background = cls._parse_lua_color(
+                    active_tab.get("bg_color")
+                )
+                tabs.active_foreground = cls._parse_lua_color(
+                    active_tab.get("fg_color")
+                )
+            inactive_tab = tab_bar.get("inactive_tab")
+            if isinstance(inactive_tab, dict):
+                tabs.inactive_background = cls._parse_lua_color(
+                    inactive_tab.get("bg_color")
+                )
+                tabs.inactive_foreground = cls._parse_lua_color(
+                    inactive_tab.get("fg_color")
+                )
+
+        return tabs
+
+    @classmethod
+    def _parse_panes(cls, config: dict, colors: dict | None) -> PaneConfig:
+        """Parse pane settings, including colors.split."""
+        panes = PaneConfig()
+        hsb = config.get("inactive_pane_hsb")
+        if hsb is not None:
+            if isinstance(hsb, dict):
+                panes.inactive_dim_factor = _to_float(hsb.get("brightness"))
+
+        focus_follows = config.get("pane_focus_follows_mouse")
+        if focus_follows is not None:
+            if isinstance(focus_follows, bool):
+                panes.focus_follows_mouse = focus_follows
+            elif _lua_token(focus_follows) is _TRUE:
+                panes.focus_follows_mouse = True
+
+        # Divider color lives in colors.split
+        if colors:
+            panes.divider_color = cls._parse_lua_color(colors.get("split"))
+
+        return panes
+
     @classmethod
     def parse(
         cls,
@@ -223,9 +555,10 @@ class WeztermAdapter(TerminalAdapter):
 
         if content is None:
             path = Path(source)
-            if not path.exists():
-                raise FileNotFoundError(f"Config file not found: {path}")
-            content = path.read_text()
+            try:
+                content = path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Config file not found: {path}") from None
 
         # Execute the Lua config with our mock wezterm module
         try:
@@ -235,35 +568,37 @@ class WeztermAdapter(TerminalAdapter):
             return ctec
 
         # Parse color_scheme (named scheme) - takes precedence if no custom colors
-        if "color_scheme" in config:
-            scheme_name = str(config["color_scheme"]).strip("'\"")
+        scheme_name = cls._get_string(config, "color_scheme")
+        if scheme_name is not None:
             if not ctec.color_scheme:
                 ctec.color_scheme = ColorScheme()
             ctec.color_scheme.name = scheme_name
 
+        # Look the colors table up once; custom, tab bar and split colors
+        # are all read from it
+        colors = config.get("colors")
+        if not isinstance(colors, dict):
+            colors = None
+
         # Parse custom colors (may override or supplement named scheme)
-        if "colors" in config:
-            colors = config["colors"]
-            if isinstance(colors, dict):
-                parsed_scheme = cls._parse_colors_dict(colors)
-                if ctec.color_scheme and ctec.color_scheme.name:
-                    # Merge custom colors with named scheme
-                    for attr in dir(parsed_scheme):
-                        if not attr.startswith("_") and attr not in (
-                            "name",
-                            "author",
-                            "variant",
-                        ):
-                            val = getattr(parsed_scheme, attr)
-                            if val is not None:
-                                setattr(ctec.color_scheme, attr, val)
-                else:
-                    ctec.color_scheme = parsed_scheme
+        if colors is not None:
+            parsed_scheme = cls._parse_colors_dict(colors)
+            if ctec.color_scheme and ctec.color_scheme.name:
+                # Merge custom colors with named scheme
+                for attr in COLOR_SCHEME_COLOR_FIELDS:
+                    val = getattr(parsed_scheme, attr)
+                    if val is not None:
+                        setattr(ctec.color_scheme, attr, val)
+            else:
+                ctec.color_scheme = parsed_scheme
+
+        # Terminal-specific settings are collected here and attached in one go
+        terminal_specific: list[TerminalSpecificSetting] = []
 
         # Parse font
         font = FontConfig()
-        if "font" in config:
-            font_val = config["font"]
+        font_val = config.get("font")
+        if font_val is not None:
             if isinstance(font_val, FontSpec):
                 font.family = font_val.family
                 if font_val.weight:
@@ -272,62 +607,48 @@ class WeztermAdapter(TerminalAdapter):
                     except (ValueError, KeyError):
                         ctec.add_warning(f"Unknown font weight: {font_val.weight}")
                 if font_val.fallbacks:
-                    font.fallback_fonts = font_val.fallbacks
+                    font.fallback_fonts = list(font_val.fallbacks)
                 # Handle HarfBuzz features -> ligatures
                 if font_val.harfbuzz_features:
                     for feature in font_val.harfbuzz_features:
-                        if feature in ("liga=0", "clig=0", "calt=0"):
+                        if feature in LIGATURES_OFF_FEATURES:
                             font.ligatures = False
                             break
                     # Store full harfbuzz features as terminal-specific for round-trip
-                    ctec.terminal_specific.append(
-                        TerminalSpecificSetting(
-                            terminal="wezterm",
+                    terminal_specific.append(
+                        _wezterm_setting(
                             key="font_harfbuzz_features",
-                            value=font_val.harfbuzz_features,
+                            value=list(font_val.harfbuzz_features),
                         )
                     )
                 # Store FreeType settings as terminal-specific
                 if font_val.freetype_load_target:
-                    ctec.terminal_specific.append(
-                        TerminalSpecificSetting(
-                            terminal="wezterm",
+                    terminal_specific.append(
+                        _wezterm_setting(
                             key="font_freetype_load_target",
                             value=font_val.freetype_load_target,
                         )
                     )
 
-        if "font_size" in config:
-            try:
-                font.size = float(config["font_size"])
-            except (ValueError, TypeError):
-                ctec.add_warning(f"Invalid font_size: {config['font_size']}")
-
-        if "line_height" in config:
-            try:
-                font.line_height = float(config["line_height"])
-            except (ValueError, TypeError):
-                ctec.add_warning(f"Invalid line_height: {config['line_height']}")
+        font.size = cls._get_number(config, "font_size", _to_float, ctec)
+        font.line_height = cls._get_number(config, "line_height", _to_float, ctec)
 
         if font.family or font.size:
             ctec.font = font
 
         # Parse cursor
         cursor = CursorConfig()
-        if "default_cursor_style" in config:
-            cursor_style = str(config["default_cursor_style"]).strip("'\"")
-            if cursor_style in cls.CURSOR_STYLE_MAP:
-                cursor.style = cls.CURSOR_STYLE_MAP[cursor_style]
-                cursor.blink = "Blinking" in cursor_style
-
-        if "cursor_blink_rate" in config:
-            try:
-                rate = int(config["cursor_blink_rate"])
-                cursor.blink = rate > 0
-                if rate > 0:
-                    cursor.blink_interval = rate
-            except (ValueError, TypeError):
-                pass
+        cursor_style = cls._get_string(config, "default_cursor_style")
+        if cursor_style is not None:
+            entry = cls.CURSOR_STYLE_MAP.get(cursor_style)
+            if entry:
+                cursor.style, cursor.blink = entry
+
+        rate = cls._get_number(config, "cursor_blink_rate", _to_int)
+        if rate is not None:
+            cursor.blink = rate > 0
+            if rate > 0:
+                cursor.blink_interval = rate
 
         if cursor.style or cursor.blink is not None:
             ctec.cursor = cursor
@@ -335,46 +656,19 @@ class WeztermAdapter(TerminalAdapter):
         # Parse window
         window = WindowConfig()
 
-        if "initial_cols" in config:
-            try:
-                window.columns = int(config["initial_cols"])
-            except (ValueError, TypeError):
-                pass
-
-        if "initial_rows" in config:
-            try:
-                window.rows = int(config["initial_rows"])
-            except (ValueError, TypeError):
-                pass
-
-        if "window_background_opacity" in config:
-            try:
-                window.opacity = float(config["window_background_opacity"])
-            except (ValueError, TypeError):
-                pass
-
-        if "macos_window_background_blur" in config:
-            try:
-                window.blur = int(config["macos_window_background_blur"])
-            except (ValueError, TypeError):
-                pass
+        window.columns = cls._get_number(config, "initial_cols", _to_int)
+        window.rows = cls._get_number(config, "initial_rows", _to_int)
+        window.opacity = cls._get_number(config, "window_background_opacity", _to_float)
+        window.blur = cls._get_number(config, "macos_window_background_blur", _to_int)
 
-        if "window_padding" in config:
-            padding = config["window_padding"]
+        padding = config.get("window_padding")
+        if padding is not None:
             if isinstance(padding, dict):
-                if "left" in padding:
-                    try:
-                        window.padding_horizontal = int(padding["left"])
-                    except (ValueError, TypeError):
-                        pass
-                if "top" in padding:
-                    try:
-                        window.padding_vertical = int(padding["top"])
-                    except (ValueError, TypeError):
-                        pass
+                window.padding_horizontal = _to_int(padding.get("left"))
+                window.padding_vertical = _to_int(padding.get("top"))
 
-        if "window_decorations" in config:
-            decorations = str(config["window_decorations"]).strip("'\"")
+        decorations = cls._get_string(config, "window_decorations")
+        if decorations is not None:
             window.decorations = decorations.upper() not in ("NONE", "RESIZE")
 
         if (
@@ -388,67 +682,61 @@ class WeztermAdapter(TerminalAdapter):
         # Parse behavior
         behavior = BehaviorConfig()
 
-        if "default_prog" in config:
-            default_prog = config["default_prog"]
+        default_prog = config.get("default_prog")
+        if default_prog is not None:
             if isinstance(default_prog, (list, tuple)) and len(default_prog) > 0:
                 behavior.shell = str(default_prog[0])
                 if len(default_prog) > 1:
-                    behavior.shell_args = [str(arg) for arg in default_prog[1:]]
-            elif isinstance(default_prog, dict):
-                # Lua table with numeric keys (1-indexed in Lua)
-                if 1 in default_prog:
-                    behavior.shell = str(default_prog[1])
-                    # Get remaining args (keys 2, 3, ...)
-                    args = []
-                    i = 2
-                    while i in default_prog:
-                        args.append(str(default_prog[i]))
-                        i += 1
-                    if args:
-                        behavior.shell_args = args
+                    behavior.shell_args = list(map(str, default_prog[1:]))
+            elif isinstance(default_prog, dict) and 1 in default_prog:
+                # Lua table with numeric keys (1-indexed in Lua). Like ipairs,
+                # stop at the first missing index.
+                behavior.shell = str(default_prog[1])
+                args = []
+                i = 2
+                while i in default_prog:
+                    args.append(str(default_prog[i]))
+                    i += 1
+                if args:
+                    behavior.shell_args = args
 
         # Parse environment variables
-        if "set_environment_variables" in config:
-            env_vars = config["set_environment_variables"]
+        env_vars = config.get("set_environment_variables")
+        if env_vars is not None:
             if isinstance(env_vars, dict):
-                behavior.environment_variables = {
-                    str(k): str(v) for k, v in env_vars.items()
-                }
-
-        if "scrollback_lines" in config:
-            try:
-                lines = int(config["scrollback_lines"])
-                ctec.scroll = ScrollConfig.from_lines(lines)
-            except (ValueError, TypeError):
-                ctec.add_warning(
-                    f"Invalid scrollback_lines: {config['scrollback_lines']}"
+                behavior.environment_variables = dict(
+                    zip(map(str, env_vars), map(str, env_vars.values()), strict=True)
                 )
 
-        if "term" in config:
-            behavior.terminal_type = str(config["term"]).strip("'\"")
+        lines = cls._get_number(config, "scrollback_lines", _to_int, ctec)
+        if lines is not None:
+            ctec.scroll = ScrollConfig.from_lines(lines)
+
+        behavior.terminal_type = cls._get_string(config, "term")
 
-        if "audible_bell" in config:
-            audible_bell = str(config["audible_bell"]).strip("'\"")
+        audible_bell = cls._get_string(config, "audible_bell")
+        if audible_bell is not None:
             if audible_bell == "Disabled":
                 behavior.bell_mode = BellMode.NONE
             else:
                 behavior.bell_mode = BellMode.AUDIBLE
 
-        if "visual_bell" in config:
-            visual_bell = config["visual_bell"]
+        visual_bell = config.get("visual_bell")
+        if visual_bell is not None:
             if isinstance(visual_bell, dict):
                 duration = visual_bell.get("fade_in_duration_ms") or visual_bell.get(
                     "duration_ms"
                 )
-                if duration and int(duration) > 0:
+                duration = _to_int(duration)
+                if duration and duration > 0:
                     behavior.bell_mode = BellMode.VISUAL
 
-        if "hide_mouse_cursor_when_typing" in config:
-            val = config["hide_mouse_cursor_when_typing"]
+        val = config.get("hide_mouse_cursor_when_typing")
+        if val is not None:
             if isinstance(val, bool):
                 behavior.mouse_hide_while_typing = val
             else:
-                behavior.mouse_hide_while_typing = str(val).lower() == "true"
+                behavior.mouse_hide_while_typing = _lua_token(val) is _TRUE
 
         if (
             behavior.shell
@@ -460,152 +748,28 @@ class WeztermAdapter(TerminalAdapter):
         ):
             ctec.behavior = behavior
 
-        # Parse tab settings
-        tabs = TabConfig()
-        if "enable_tab_bar" in config:
-            enable_tab_bar = config["enable_tab_bar"]
-            if isinstance(enable_tab_bar, bool) and not enable_tab_bar:
-                tabs.visibility = TabBarVisibility.NEVER
-            elif str(enable_tab_bar).lower() == "false":
-                tabs.visibility = TabBarVisibility.NEVER
-
-        if "tab_bar_at_bottom" in config:
-            tab_bar_at_bottom = config["tab_bar_at_bottom"]
-            if isinstance(tab_bar_at_bottom, bool):
-                tabs.position = (
-                    TabBarPosition.BOTTOM if tab_bar_at_bottom else TabBarPosition.TOP
-                )
-            elif str(tab_bar_at_bottom).lower() == "true":
-                tabs.position = TabBarPosition.BOTTOM
-            else:
-                tabs.position = TabBarPosition.TOP
-
-        if "use_fancy_tab_bar" in config:
-            use_fancy = config["use_fancy_tab_bar"]
-            if isinstance(use_fancy, bool):
-                tabs.style = TabBarStyle.FANCY if use_fancy else TabBarStyle.NATIVE
-            elif str(use_fancy).lower() == "true":
-                tabs.style = TabBarStyle.FANCY
-            else:
-                tabs.style = TabBarStyle.NATIVE
-
-        if "hide_tab_bar_if_only_one_tab" in config:
-            hide_single = config["hide_tab_bar_if_only_one_tab"]
-            if isinstance(hide_single, bool):
-                tabs.auto_hide_single = hide_single
-            elif str(hide_single).lower() == "true":
-                tabs.auto_hide_single = True
-
-        if "tab_max_width" in config:
-            try:
-                tabs.max_width = int(config["tab_max_width"])
-            except (ValueError, TypeError):
-                pass
-
-        if "show_tab_index_in_tab_bar" in config:
-            show_index = config["show_tab_index_in_tab_bar"]
-            if isinstance(show_index, bool):
-                tabs.show_index = show_index
-            elif str(show_index).lower() == "true":
-                tabs.show_index = True
-
-        # Parse tab colors from colors.tab_bar
-        if "colors" in config:
-            colors = config["colors"]
-            if isinstance(colors, dict):
-                if "tab_bar" in colors:
-                    tab_bar = colors["tab_bar"]
-                    if isinstance(tab_bar, dict):
-                        if "background" in tab_bar:
-                            tabs.bar_background = cls._parse_lua_color(
-                                tab_bar["background"]
-                            )
-                        if "active_tab" in tab_bar:
-                            active_tab = tab_bar["active_tab"]
-                            if isinstance(active_tab, dict):
-                                if "bg_color" in active_tab:
-                                    tabs.active_background = cls._parse_lua_color(
-                                        active_tab["bg_color"]
-                                    )
-                                if "fg_color" in active_tab:
-                                    tabs.active_foreground = cls._parse_lua_color(
-                                        active_tab["fg_color"]
-                                    )
-                        if "inactive_tab" in tab_bar:
-                            inactive_tab = tab_bar["inactive_tab"]
-                            if isinstance(inactive_tab, dict):
-                                if "bg_color" in inactive_tab:
-                                    tabs.inactive_background = cls._parse_lua_color(
-                                        inactive_tab["bg_color"]
-                                    )
-                                if "fg_color" in inactive_tab:
-                                    tabs.inactive_foreground = cls._parse_lua_color(
-                                        inactive_tab["fg_color"]
-                                    )
-
-        # Add tabs if any tab settings were configured
-        if any(
-            getattr(tabs, f) is not None
-            for f in [
-                "visibility",
-                "position",
-                "style",
-                "auto_hide_single",
-                "max_width",
-                "show_index",
-                "active_foreground",
-                "active_background",
-                "inactive_foreground",
-                "inactive_background",
-                "bar_background",
-            ]
-        ):
-            ctec.tabs = tabs
-
-        # Parse pane settings
-        panes = PaneConfig()
-        if "inactive_pane_hsb" in config:
-            hsb = config["inactive_pane_hsb"]
-            if isinstance(hsb, dict) and "brightness" in hsb:
-                try:
-                    panes.inactive_dim_factor = float(hsb["brightness"])
-                except (ValueError, TypeError):
-                    pass
-
-        if "pane_focus_follows_mouse" in config:
-            focus_follows = config["pane_focus_follows_mouse"]
-            if isinstance(focus_follows, bool):
-                panes.focus_follows_mouse = focus_follows
-            elif str(focus_follows).lower() == "true":
-                panes.focus_follows_mouse = True
+        # Parse tab and pane settings, skipping each section outright when
+        # none of its keys are present
+        if not config.keys().isdisjoint(TAB_KEYS) or (colors and "tab_bar" in colors):
+            tabs = cls._parse_tabs(config, colors)
+            if not tabs.is_empty():
+                ctec.tabs = tabs
 
-        # Check for divider color from colors.split parsed above
-        if "colors" in config and isinstance(config["colors"], dict):
-            if "split" in config["colors"]:
-                panes.divider_color = cls._parse_lua_color(config["colors"]["split"])
-
-        # Add panes if any pane settings were configured
-        if any(
-            getattr(panes, f) is not None
-            for f in [
-                "inactive_dim_factor",
-                "divider_color",
-                "focus_follows_mouse",
-            ]
-        ):
-            ctec.panes = panes
+        if not config.keys().isdisjoint(PANE_KEYS) or (colors and "split" in colors):
+            panes = cls._parse_panes(config, colors)
+            if not panes.is_empty():
+                ctec.panes = panes
 
         # Parse leader key
-        if "leader" in config:
-            leader = config["leader"]
+        leader = config.get("leader")
+        if leader is not None:
             if isinstance(leader, dict):
                 leader_key = leader.get("key")
                 leader_mods = leader.get("mods", "")
                 leader_timeout = leader.get("timeout_milliseconds", 1000)
                 if leader_key:
-                    ctec.terminal_specific.append(
-                        TerminalSpecificSetting(
-                            terminal="wezterm",
+                    terminal_specific.append(
+                        _wezterm_setting(
                             key="leader",
                             value={
                                 "key": leader_key,
@@ -616,13 +780,12 @@ class WeztermAdapter(TerminalAdapter):
                     )
 
         # Parse key_tables (for round-trip preservation)
-        if "key_tables" in config:
-            key_tables = config["key_tables"]
+        key_tables = config.get("key_tables")
+        if key_tables is not None:
             if isinstance(key_tables, dict):
                 # Store the raw key_tables for round-trip
-                ctec.terminal_specific.append(
-                    TerminalSpecificSetting(
-                        terminal="wezterm",
+                terminal_specific.append(
+                    _wezterm_setting(
                         key="key_tables",
                         value=key_tables,
                     )
@@ -630,12 +793,11 @@ class WeztermAdapter(TerminalAdapter):
 
         # Parse window_frame (for round-trip preservation)
         # This controls the fancy tab bar appearance (fonts, colors)
-        if "window_frame" in config:
-            window_frame = config["window_frame"]
+        window_frame = config.get("window_frame")
+        if window_frame is not None:
             if isinstance(window_frame, dict):
-                ctec.terminal_specific.append(
-                    TerminalSpecificSetting(
-                        terminal="wezterm",
+                terminal_specific.append(
+                    _wezterm_setting(
                         key="window_frame",
                         value=window_frame,
                     )
@@ -643,88 +805,37 @@ class WeztermAdapter(TerminalAdapter):
 
         # Parse multiplexer domain configurations (for round-trip preservation)
         # These are WezTerm-specific features for SSH, Unix socket, and TLS domains
-        domain_types = [
-            "ssh_domains",
-            "unix_domains",
-            "tls_clients",
-            "tls_servers",
-            "exec_domains",
-        ]
-        for domain_type in domain_types:
-            if domain_type in config:
-                domain_config = config[domain_type]
+        for domain_type in DOMAIN_TYPES:
+            domain_config = config.get(domain_type)
+            if domain_config is not None:
                 if domain_config:
-                    ctec.terminal_specific.append(
-                        TerminalSpecificSetting(
-                            terminal="wezterm",
+                    terminal_specific.append(
+                        _wezterm_setting(
                             key=domain_type,
                             value=domain_config,
                         )
                     )
 
         # Parse key bindings
-        if "keys" in config:
-            keys = config["keys"]
+        keys = config.get("keys")
+        if keys is not None:
             if isinstance(keys, (list, dict)):
                 # Convert dict with numeric keys to list
                 if isinstance(keys, dict):
-                    keys = [keys[i] for i in sorted(keys.keys()) if isinstance(i, int)]
+                    keys = cls._lua_array_values(keys)
 
                 for binding in keys:
-                    if isinstance(binding, dict):
-                        key = binding.get("key")
-                        mods = binding.get("mods", "")
-                        action = binding.get("action")
-
-                        if key and action:
-                            # Parse modifiers
-                            mod_list = []
-                            if mods:
-                                mod_list = [m.strip() for m in str(mods).split("|")]
-
-                            # Check for LEADER modifier
-                            has_leader = "LEADER" in mod_list
-                            if has_leader:
-                                mod_list = [m for m in mod_list if m != "LEADER"]
-
-                            # Parse action
-                            action_name = None
-                            action_param = None
-                            if isinstance(action, ActionSpec):
-                                action_name = action.name
-                                if action.args:
-                                    # Handle different argument types
-                                    arg = action.args[0]
-                                    if isinstance(arg, dict):
-                                        # Table argument - store as JSON-like string
-                                        action_param = str(arg)
-                                    else:
-                                        action_param = str(arg)
-                            elif isinstance(action, str):
-                                action_name = action
-
-                            if action_name:
-                                kb = KeyBinding(
-                                    action=action_name,
-                                    key=str(key),
-                                    mods=mod_list,
-                                    action_param=action_param,
-                                )
-                                # Store leader info in key_sequence for conceptual mapping
-                                if has_leader:
-                                    # Mark this as a leader-based binding
-                                    kb.key_sequence = ["LEADER"]
-                                ctec.key_bindings.append(kb)
+                    kb = cls._parse_key_binding(binding)
+                    if kb is not None:
+                        ctec.key_bindings.append(kb)
 
         # Parse hyperlink_rules
-        if "hyperlink_rules" in config:
-            rules = config["hyperlink_rules"]
+        rules = config.get("hyperlink_rules")
+        if rules is not None:
             if isinstance(rules, (list, dict)):
                 # Convert dict with numeric keys to list
                 if isinstance(rules, dict):
-                    rules = [
-                        rules[i] for i in sorted(rules.keys()) if isinstance(i, int)
-                    ]
+                    rules = cls._lua_array_values(rules)
 
                 hints = TextHintConfig(enabled=True)
                 for rule in rules:
@@ -738,9 +849,9 @@ class WeztermAdapter(TerminalAdapter):
                                 parameter=str(url_format) if url_format else None,
                             )
                             # Detect if it's a URL pattern
-                            if url_format and (
-                                "http" in str(url_format).lower()
-                                or "mailto" in str(url_format).lower()
+                            if (
+                                url_format
+                                and _URL_HINT_RE.search(str(url_format)) is not None
                             ):
                                 hint_rule.hyperlinks = True
                             hints.rules.append(hint_rule)
@@ -749,8 +860,8 @@ class WeztermAdapter(TerminalAdapter):
                     ctec.text_hints = hints
 
         # Capture wezterm.on() event callbacks (for round-trip warning)
-        if "_wezterm_events" in config:
-            events = config["_wezterm_events"]
+        events = config.get("_wezterm_events")
+        if events is not None:
             if events:
                 event_names = [
                     e.event_name for e in events if isinstance(e, EventCallback)
@@ -761,14 +872,16 @@ class WeztermAdapter(TerminalAdapter):
                         "translated to other terminals. These will be lost during conversion."
                     )
                     # Store event names for potential round-trip
-                    ctec.terminal_specific.append(
-                        TerminalSpecificSetting(
-                            terminal="wezterm",
+                    terminal_specific.append(
+                        _wezterm_setting(
                             key="event_callbacks",
                             value=event_names,
                         )
                     )
 
+        if terminal_specific:
+            ctec.terminal_specific.extend(terminal_specific)
+
         return ctec
 
     @classmethod
@@ -777,449 +890,360 @@ class WeztermAdapter(TerminalAdapter):
         if param is None:
             return f"wezterm.action.{action}"
 
-        # Check if we have special formatting for this action
-        if action in ACTION_PARAM_FORMATS:
-            param_name, is_table = ACTION_PARAM_FORMATS[action]
-            if param_name is None:
-                # No parameter needed
-                return f"wezterm.action.{action}"
-            elif is_table:
-                # Table parameter: action { param_name = value }
-                return f'wezterm.action.{action} {{ {param_name} = "{param}" }}'
-            else:
-                # Simple function call: action(value)
-                return f'wezterm.action.{action}("{param}")'
-
-        # Default: simple function call
-        return f'wezterm.action.{action}("{param}")'
+        template = ACTION_TEMPLATES.get(action)
+        if template is None:
+            # Default: simple function call
+            return f'wezterm.action.{action}("{param}")'
+        return template.format(param=param)
 
     @classmethod
-    def export(cls, ctec: CTEC) -> str:
+    def export(cls, ctec: CTEC, *, quiet: bool = False) -> str:
         """Export CTEC to Wezterm Lua configuration format."""
-        lines = [
-            "-- Wezterm configuration",
-            "-- Generated by console-cowboy",
-            "",
-            "local wezterm = require 'wezterm'",
-            "local config = wezterm.config_builder()",
-            "",
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        add_warning = ctec.add_warning
+        format_action = cls._format_action
+
+        # Fetch wezterm-specific settings once and index them by key so the
+        # restore sections below are dict lookups rather than rescans.
+        # The first setting for a key wins.
+        wezterm_specific = ctec.get_terminal_specific("wezterm")
+        wezterm_settings: dict[str, object] = {}
+        for setting in wezterm_specific:
+            wezterm_settings.setdefault(setting.key, setting.value)
+
+        write(EXPORT_PREAMBLE)
 
         # Export color_scheme by name (if available)
         if ctec.color_scheme and ctec.color_scheme.name:
-            lines.append("-- Color scheme")
-            lines.append(f'config.color_scheme = "{ctec.color_scheme.name}"')
-            lines.append("")
+            write(
+                f'-- Color scheme\nconfig.color_scheme = "{ctec.color_scheme.name}"\n\n'
+            )
 
         # Export custom colors (if any colors are set beyond just the name)
         if ctec.color_scheme:
             scheme = ctec.color_scheme
             has_custom_colors = any(
-                [
-                    scheme.foreground,
-                    scheme.background,
-                    scheme.cursor,
-                    scheme.cursor_text,
-                    scheme.selection,
-                    scheme.selection_text,
-                    scheme.black,
-                    scheme.red,
-                ]
+                getattr(scheme, name)
+                for name in (
+                    "foreground",
+                    "background",
+                    "cursor",
+                    "cursor_text",
+                    "selection",
+                    "selection_text",
+                    "black",
+                    "red",
+                )
             )
 
             if has_custom_colors:
-                lines.append("-- Custom colors")
-                lines.append("config.colors = {")
-
-                if scheme.foreground:
-                    lines.append(f'  foreground = "{scheme.foreground.to_hex()}",')
-                if scheme.background:
-                    lines.append(f'  background = "{scheme.background.to_hex()}",')
-                if scheme.cursor:
-                    lines.append(f'  cursor_bg = "{scheme.cursor.to_hex()}",')
-                if scheme.cursor_text:
-                    lines.append(f'  cursor_fg = "{scheme.cursor_text.to_hex()}",')
-                if scheme.selection:
-                    lines.append(f'  selection_bg = "{scheme.selection.to_hex()}",')
-                if scheme.selection_text:
-                    lines.append(
-                        f'  selection_fg = "{scheme.selection_text.to_hex()}",'
-                    )
-
-                # ANSI colors
-                ansi_colors = []
-                for attr in [
-                    "black",
-                    "red",
-                    "green",
-                    "yellow",
-                    "blue",
-                    "magenta",
-                    "cyan",
-                    "white",
-                ]:
-                    color = getattr(scheme, attr, None)
-                    if color:
-                        ansi_colors.append(f'"{color.to_hex()}"')
-                if ansi_colors:
-                    lines.append(f"  ansi = {{ {', '.join(ansi_colors)} }},")
-
-                # Bright colors
-                bright_colors = []
-                for attr in [
-                    "bright_black",
-                    "bright_red",
-                    "bright_green",
-                    "bright_yellow",
-                    "bright_blue",
-                    "bright_magenta",
-                    "bright_cyan",
-                    "bright_white",
-                ]:
-                    color = getattr(scheme, attr, None)
+                # Collect the table entries, then emit the block in one write
+                entries = []
+                for wez_key, attr in COLOR_KEY_MAP.items():
+                    color = getattr(scheme, attr)
                     if color:
-                        bright_colors.append(f'"{color.to_hex()}"')
-                if bright_colors:
-                    lines.append(f"  brights = {{ {', '.join(bright_colors)} }},")
+                        entries.append(f'  {wez_key} = "{color.to_hex()}",\n')
+
+                # ANSI and bright palettes
+                for palette, names in PALETTE_NAMES.items():
+                    palette_colors = _lua_string_list(
+                        color.to_hex()
+                        for color in (getattr(scheme, name, None) for name in names)
+                        if color
+                    )
+                    if palette_colors:
+                        entries.append(f"  {palette} = {{ {palette_colors} }},\n")
 
-                lines.append("}")
-                lines.append("")
+                write(f"-- Custom colors\nconfig.colors = {{\n{''.join(entries)}}}\n\n")
 
         # Export font
-        if ctec.font:
-            lines.append("-- Font")
-            if ctec.font.family:
-                font_family = ctec.font.family
+        font = ctec.font
+        if font:
+            write("-- Font\n")
+            if font.family:
+                font_family = font.family
                 # Convert PostScript names to friendly names for Wezterm
                 if is_postscript_name(font_family):
                     font_family = postscript_to_friendly(font_family)
 
                 # Check for HarfBuzz features to restore
-                harfbuzz_features = None
-                freetype_load_target = None
-                for setting in ctec.get_terminal_specific("wezterm"):
-                    if setting.key == "font_harfbuzz_features":
-                        harfbuzz_features = setting.value
-                    elif setting.key == "font_freetype_load_target":
-                        freetype_load_target = setting.value
+                harfbuzz_features = wezterm_settings.get("font_harfbuzz_features")
+                freetype_load_target = wezterm_settings.get("font_freetype_load_target")
 
                 # If ligatures is explicitly false and no stored features, add liga=0
-                if ctec.font.ligatures is False and not harfbuzz_features:
-                    harfbuzz_features = ["liga=0", "clig=0", "calt=0"]
+                if font.ligatures is False and not harfbuzz_features:
+                    harfbuzz_features = list(LIGATURES_OFF_FEATURES)
 
                 # Build font options
                 font_opts = []
-                if ctec.font.weight:
-                    font_opts.append(f'weight = "{ctec.font.weight.to_string()}"')
+                if font.weight:
+                    font_opts.append(f'weight = "{font.weight.to_string()}"')
                 if harfbuzz_features:
-                    features_str = ", ".join(f'"{f}"' for f in harfbuzz_features)
+                    features_str = _lua_string_list(harfbuzz_features)
                     font_opts.append(f"harfbuzz_features = {{ {features_str} }}")
                 if freetype_load_target:
                     font_opts.append(f'freetype_load_target = "{freetype_load_target}"')
 
                 # Determine if we need fallback fonts
-                if ctec.font.fallback_fonts:
+                if font.fallback_fonts:
                     # WezTerm font_with_fallback
                     if font_opts:
                         opts_str = ", ".join(font_opts)
                         primary = f'{{ family = "{font_family}", {opts_str} }}'
                     else:
                         primary = f'"{font_family}"'
-                    fallbacks_str = ", ".join(
-                        f'"{f}"' for f in ctec.font.fallback_fonts
-                    )
-                    lines.append(
-                        f"config.font = wezterm.font_with_fallback({{ {primary}, {fallbacks_str} }})"
+                    fallbacks_str = _lua_string_list(font.fallback_fonts)
+                    write(
+                        f"config.font = wezterm.font_with_fallback({{ {primary}, {fallbacks_str} }})\n"
                     )
                 elif font_opts:
                     # Use font with options
                     opts_str = ", ".join(font_opts)
-                    lines.append(
-                        f'config.font = wezterm.font("{font_family}", {{ {opts_str} }})'
+                    write(
+                        f'config.font = wezterm.font("{font_family}", {{ {opts_str} }})\n'
                     )
                 else:
-                    lines.append(f'config.font = wezterm.font("{font_family}")')
+                    write(f'config.font = wezterm.font("{font_family}")\n')
 
-            if ctec.font.size:
-                lines.append(f"config.font_size = {ctec.font.size}")
-            if ctec.font.line_height:
-                lines.append(f"config.line_height = {ctec.font.line_height}")
-            lines.append("")
+            if font.size:
+                write(f"config.font_size = {font.size}\n")
+            if font.line_height:
+                write(f"config.line_height = {font.line_height}\n")
+            write("\n")
 
         # Export cursor
-        if ctec.cursor:
-            lines.append("-- Cursor")
-            if ctec.cursor.style:
-                style_map = {
-                    CursorStyle.BLOCK: ("SteadyBlock", "BlinkingBlock"),
-                    CursorStyle.BEAM: ("SteadyBar", "BlinkingBar"),
-                    CursorStyle.UNDERLINE: ("SteadyUnderline", "BlinkingUnderline"),
-                }
-                styles = style_map.get(
-                    ctec.cursor.style, ("SteadyBlock", "BlinkingBlock")
+        cursor = ctec.cursor
+        if cursor:
+            write("-- Cursor\n")
+            if cursor.style:
+                blink = bool(cursor.blink)
+                style = cls.CURSOR_STYLE_EXPORT_MAP.get(
+                    (cursor.style, blink),
+                    "BlinkingBlock" if blink else "SteadyBlock",
                 )
-                style = styles[1] if ctec.cursor.blink else styles[0]
-                lines.append(f'config.default_cursor_style = "{style}"')
-            if ctec.cursor.blink_interval:
-                lines.append(f"config.cursor_blink_rate = {ctec.cursor.blink_interval}")
-            lines.append("")
+                write(f'config.default_cursor_style = "{style}"\n')
+            if cursor.blink_interval:
+                write(f"config.cursor_blink_rate = {cursor.blink_interval}\n")
+            write("\n")
 
         # Export window
-        if ctec.window:
-            lines.append("-- Window")
-            if ctec.window.columns:
-                lines.append(f"config.initial_cols = {ctec.window.columns}")
-            if ctec.window.rows:
-                lines.append(f"config.initial_rows = {ctec.window.rows}")
-            if ctec.window.opacity is not None:
-                lines.append(
-                    f"config.window_background_opacity = {ctec.window.opacity}"
-                )
-            if ctec.window.blur is not None:
-                lines.append(
-                    "-- Note: macos_window_background_blur only works on macOS"
-                )
-                lines.append(
-                    f"config.macos_window_background_blur = {ctec.window.blur}"
+        window = ctec.window
+        if window:
+            write("-- Window\n")
+            if window.columns:
+                write(f"config.initial_cols = {window.columns}\n")
+            if window.rows:
+                write(f"config.initial_rows = {window.rows}\n")
+            if window.opacity is not None:
+                write(f"config.window_background_opacity = {window.opacity}\n")
+            if window.blur is not None:
+                write(
+                    "-- Note: macos_window_background_blur only works on macOS\n"
+                    f"config.macos_window_background_blur = {window.blur}\n"
                 )
             if (
-                ctec.window.padding_horizontal is not None
-                or ctec.window.padding_vertical is not None
+                window.padding_horizontal is not None
+                or window.padding_vertical is not None
             ):
-                h = ctec.window.padding_horizontal or 0
-                v = ctec.window.padding_vertical or 0
-                lines.append("config.window_padding = {")
-                lines.append(f"  left = {h},")
-                lines.append(f"  right = {h},")
-                lines.append(f"  top = {v},")
-                lines.append(f"  bottom = {v},")
-                lines.append("}")
-            if ctec.window.decorations is not None:
-                val = "FULL" if ctec.window.decorations else "NONE"
-                lines.append(f'config.window_decorations = "{val}"')
-            lines.append("")
+                h = window.padding_horizontal or 0
+                v = window.padding_vertical or 0
+                write(
+                    "config.window_padding = {\n"
+                    f"  left = {h},\n"
+                    f"  right = {h},\n"
+                    f"  top = {v},\n"
+                    f"  bottom = {v},\n"
+                    "}\n"
+                )
+            if window.decorations is not None:
+                val = "FULL" if window.decorations else "NONE"
+                write(f'config.window_decorations = "{val}"\n')
+            write("\n")
 
         # Export behavior
-        if ctec.behavior:
-            lines.append("-- Behavior")
-            if ctec.behavior.shell or ctec.behavior.shell_args:
-                prog_parts = []
-                if ctec.behavior.shell:
-                    prog_parts.append(f'"{ctec.behavior.shell}"')
-                if ctec.behavior.shell_args:
-                    prog_parts.extend(f'"{arg}"' for arg in ctec.behavior.shell_args)
-                if prog_parts:
-                    prog_str = ", ".join(prog_parts)
-                    lines.append(f"config.default_prog = {{ {prog_str} }}")
-            if ctec.behavior.environment_variables:
-                lines.append("config.set_environment_variables = {")
-                for env_key, env_value in ctec.behavior.environment_variables.items():
-                    lines.append(f'  {env_key} = "{env_value}",')
-                lines.append("}")
-            if ctec.behavior.terminal_type:
-                lines.append(f'config.term = "{ctec.behavior.terminal_type}"')
-            if ctec.behavior.bell_mode is not None:
-                if ctec.behavior.bell_mode == BellMode.NONE:
-                    lines.append('config.audible_bell = "Disabled"')
-                elif ctec.behavior.bell_mode == BellMode.VISUAL:
-                    lines.append('config.audible_bell = "Disabled"')
-                    lines.append("config.visual_bell = {")
-                    lines.append('  fade_in_function = "EaseIn",')
-                    lines.append("  fade_in_duration_ms = 50,")
-                    lines.append('  fade_out_function = "EaseOut",')
-                    lines.append("  fade_out_duration_ms = 50,")
-                    lines.append("}")
+        behavior = ctec.behavior
+        if behavior:
+            write("-- Behavior\n")
+            if behavior.shell or behavior.shell_args:
+                argv = behavior.shell_args or []
+                if behavior.shell:
+                    argv = [behavior.shell, *argv]
+                prog_str = _lua_string_list(argv)
+                write(f"config.default_prog = {{ {prog_str} }}\n")
+            if behavior.environment_variables:
+                env_entries = "".join(
+                    f'  {env_key} = "{env_value}",\n'
+                    for env_key, env_value in behavior.environment_variables.items()
+                )
+                write(f"config.set_environment_variables = {{\n{env_entries}}}\n")
+            if behavior.terminal_type:
+                write(f'config.term = "{behavior.terminal_type}"\n')
+            if behavior.bell_mode is not None:
+                if behavior.bell_mode == BellMode.NONE:
+                    write('config.audible_bell = "Disabled"\n')
+                elif behavior.bell_mode == BellMode.VISUAL:
+                    write(VISUAL_BELL_BLOCK)
                 else:
-                    lines.append('config.audible_bell = "SystemBeep"')
-            if ctec.behavior.mouse_hide_while_typing is not None:
-                val = "true" if ctec.behavior.mouse_hide_while_typing else "false"
-                lines.append(f"config.hide_mouse_cursor_when_typing = {val}")
-            if ctec.behavior.copy_on_select is not None:
-                ctec.add_warning(
+                    write('config.audible_bell = "SystemBeep"\n')
+            if behavior.mouse_hide_while_typing is not None:
+                val = _LUA_BOOL[bool(behavior.mouse_hide_while_typing)]
+                write(f"config.hide_mouse_cursor_when_typing = {val}\n")
+            if behavior.copy_on_select is not None:
+                add_warning(
                     "WezTerm does not have a simple copy_on_select setting. "
                     "To enable copy-on-select, configure mouse_bindings with "
                     "CompleteSelection='Clipboard'. See WezTerm documentation for details."
                 )
-            lines.append("")
+            write("\n")
 
         # Export scroll settings (Wezterm default is 3500 lines)
-        if ctec.scroll:
-            lines.append("-- Scrollback")
+        scroll = ctec.scroll
+        if scroll:
+            write("-- Scrollback\n")
             # Wezterm doesn't have explicit unlimited mode, use large value
-            scroll_lines = ctec.scroll.get_effective_lines(
-                default=3500, max_lines=1000000
-            )
-            if (
-                ctec.scroll.disabled
-                or ctec.scroll.lines is not None
-                or ctec.scroll.unlimited
-            ):
-                lines.append(f"config.scrollback_lines = {scroll_lines}")
-            lines.append("")
+            scroll_lines = scroll.get_effective_lines(default=3500, max_lines=1000000)
+            if scroll.disabled or scroll.lines is not None or scroll.unlimited:
+                write(f"config.scrollback_lines = {scroll_lines}\n")
+            write("\n")
 
         # Export tab settings
-        if ctec.tabs:
-            lines.append("-- Tab Bar")
-            if ctec.tabs.visibility == TabBarVisibility.NEVER:
-                lines.append("config.enable_tab_bar = false")
+        tabs = ctec.tabs
+        if tabs:
+            write("-- Tab Bar\n")
+            if tabs.visibility == TabBarVisibility.NEVER:
+                write("config.enable_tab_bar = false\n")
             else:
-                lines.append("config.enable_tab_bar = true")
-            if ctec.tabs.position is not None:
-                if ctec.tabs.position == TabBarPosition.BOTTOM:
-                    lines.append("config.tab_bar_at_bottom = true")
+                write("config.enable_tab_bar = true\n")
+            if tabs.position is not None:
+                if tabs.position == TabBarPosition.BOTTOM:
+                    write("config.tab_bar_at_bottom = true\n")
                 else:
-                    lines.append("config.tab_bar_at_bottom = false")
-            if ctec.tabs.style is not None:
-                if ctec.tabs.style == TabBarStyle.FANCY:
-                    lines.append("config.use_fancy_tab_bar = true")
-                elif ctec.tabs.style == TabBarStyle.NATIVE:
-                    lines.append("config.use_fancy_tab_bar = false")
+                    write("config.tab_bar_at_bottom = false\n")
+            if tabs.style is not None:
+                if tabs.style == TabBarStyle.FANCY:
+                    write("config.use_fancy_tab_bar = true\n")
+                elif tabs.style == TabBarStyle.NATIVE:
+                    write("config.use_fancy_tab_bar = false\n")
                 else:
-                    ctec.add_warning(
+                    add_warning(
                         f"WezTerm only supports native/fancy tab styles. "
-                        f"Style '{ctec.tabs.style.value}' will be exported as native."
-                    )
-                    lines.append("config.use_fancy_tab_bar = false")
-            if ctec.tabs.auto_hide_single is not None:
-                val = "true" if ctec.tabs.auto_hide_single else "false"
-                lines.append(f"config.hide_tab_bar_if_only_one_tab = {val}")
-            if ctec.tabs.max_width is not None:
-                lines.append(f"config.tab_max_width = {ctec.tabs.max_width}")
-            if ctec.tabs.show_index is not None:
-                val = "true" if ctec.tabs.show_index else "false"
-                lines.append(f"config.show_tab_index_in_tab_bar = {val}")
-            lines.append("")
-
-            # Tab colors need to be added to config.colors
-            has_tab_colors = any(
-                getattr(ctec.tabs, f) is not None
-                for f in [
-                    "active_foreground",
-                    "active_background",
-                    "inactive_foreground",
-                    "inactive_background",
-                    "bar_background",
-                ]
-            )
-            if has_tab_colors:
-                lines.append("-- Tab colors")
-                lines.append("config.colors = config.colors or {}")
-                lines.append("config.colors.tab_bar = {")
-                if ctec.tabs.bar_background is not None:
-                    lines.append(
-                        f'  background = "{ctec.tabs.bar_background.to_hex()}",'
+                        f"Style '{tabs.style.value}' will be exported as native."
                     )
-                if (
-                    ctec.tabs.active_foreground is not None
-                    or ctec.tabs.active_background is not None
-                ):
-                    lines.append("  active_tab = {")
-                    if ctec.tabs.active_foreground is not None:
-                        lines.append(
-                            f'    fg_color = "{ctec.tabs.active_foreground.to_hex()}",'
-                        )
-                    if ctec.tabs.active_background is not None:
-                        lines.append(
-                            f'    bg_color = "{ctec.tabs.active_background.to_hex()}",'
-                        )
-                    lines.append("  },")
-                if (
-                    ctec.tabs.inactive_foreground is not None
-                    or ctec.tabs.inactive_background is not None
-                ):
-                    lines.append("  inactive_tab = {")
-                    if ctec.tabs.inactive_foreground is not None:
-                        lines.append(
-                            f'    fg_color = "{ctec.tabs.inactive_foreground.to_hex()}",'
-                        )
-                    if ctec.tabs.inactive_background is not None:
-                        lines.append(
-                            f'    bg_color = "{ctec.tabs.inactive_background.to_hex()}",'
-                        )
-                    lines.append("  },")
-                lines.append("}")
-                lines.append("")
+                    write("config.use_fancy_tab_bar = false\n")
+            if tabs.auto_hide_single is not None:
+                val = _LUA_BOOL[bool(tabs.auto_hide_single)]
+                write(f"config.hide_tab_bar_if_only_one_tab = {val}\n")
+            if tabs.max_width is not None:
+                write(f"config.tab_max_width = {tabs.max_width}\n")
+            if tabs.show_index is not None:
+                val = _LUA_BOOL[bool(tabs.show_index)]
+                write(f"config.show_tab_index_in_tab_bar = {val}\n")
+            write("\n")
+
+            # Tab colors need to be added to config.colors. Read them once; a
+            # tab config without colors skips the block on a single check.
+            tab_colors = [getattr(tabs, f) for f in TAB_COLOR_FIELDS]
+            if tab_colors.count(None) < len(tab_colors):
+                active_fg, active_bg, inactive_fg, inactive_bg, bar_bg = tab_colors
+                write(
+                    "-- Tab colors\n"
+                    "config.colors = config.colors or {}\n"
+                    "config.colors.tab_bar = {\n"
+                )
+                if bar_bg is not None:
+                    write(f'  background = "{bar_bg.to_hex()}",\n')
+                if active_fg is not None or active_bg is not None:
+                    write("  active_tab = {\n")
+                    if active_fg is not None:
+                        write(f'    fg_color = "{active_fg.to_hex()}",\n')
+                    if active_bg is not None:
+                        write(f'    bg_color = "{active_bg.to_hex()}",\n')
+                    write("  },\n")
+                if inactive_fg is not None or inactive_bg is not None:
+                    write("  inactive_tab = {\n")
+                    if inactive_fg is not None:
+                        write(f'    fg_color = "{inactive_fg.to_hex()}",\n')
+                    if inactive_bg is not None:
+                        write(f'    bg_color = "{inactive_bg.to_hex()}",\n')
+                    write("  },\n")
+                write("}\n\n")
 
             # Warn about unsupported tab features
             unsupported = []
-            if ctec.tabs.new_tab_position is not None:
+            if tabs.new_tab_position is not None:
                 unsupported.append("new_tab_position")
-            if ctec.tabs.inherit_working_directory is not None:
+            if tabs.inherit_working_directory is not None:
                 unsupported.append("inherit_working_directory")
             if unsupported:
-                ctec.add_warning(
+                add_warning(
                     f"WezTerm does not support: {', '.join(unsupported)}. "
                     "These tab settings will not be exported."
                 )
 
         # Export pane settings
-        if ctec.panes:
-            lines.append("-- Pane Settings")
-            if ctec.panes.inactive_dim_factor is not None:
-                lines.append("config.inactive_pane_hsb = {")
-                lines.append("  saturation = 1.0,")
-                lines.append("  hue = 1.0,")
-                lines.append(f"  brightness = {ctec.panes.inactive_dim_factor},")
-                lines.append("}")
-            if ctec.panes.focus_follows_mouse is not None:
-                val = "true" if ctec.panes.focus_follows_mouse else "false"
-                lines.append(f"config.pane_focus_follows_mouse = {val}")
-            if ctec.panes.divider_color is not None:
-                lines.append("config.colors = config.colors or {}")
-                lines.append(
-                    f'config.colors.split = "{ctec.panes.divider_color.to_hex()}"'
+        panes = ctec.panes
+        if panes:
+            write("-- Pane Settings\n")
+            if panes.inactive_dim_factor is not None:
+                write(
+                    "config.inactive_pane_hsb = {\n"
+                    "  saturation = 1.0,\n"
+                    "  hue = 1.0,\n"
+                    f"  brightness = {panes.inactive_dim_factor},\n"
+                    "}\n"
+                )
+            if panes.focus_follows_mouse is not None:
+                val = _LUA_BOOL[bool(panes.focus_follows_mouse)]
+                write(f"config.pane_focus_follows_mouse = {val}\n")
+            if panes.divider_color is not None:
+                write(
+                    "config.colors = config.colors or {}\n"
+                    f'config.colors.split = "{panes.divider_color.to_hex()}"\n'
                 )
-            lines.append("")
+            write("\n")
 
             # Warn about unsupported pane features
             unsupported = []
-            if ctec.panes.inactive_dim_color is not None:
+            if panes.inactive_dim_color is not None:
                 unsupported.append("inactive_dim_color")
             if unsupported:
-                ctec.add_warning(
+                add_warning(
                     f"WezTerm does not support: {', '.join(unsupported)}. "
                     "These pane settings will not be exported."
                 )
 
         # Export leader key (from terminal-specific settings)
-        leader_setting = None
-        key_tables_setting = None
-        for setting in ctec.get_terminal_specific("wezterm"):
-            if setting.key == "leader":
-                leader_setting = setting.value
-            elif setting.key == "key_tables":
-                key_tables_setting = setting.value
-
+        leader_setting = wezterm_settings.get("leader")
         if leader_setting:
-            lines.append("-- Leader key")
+            write("-- Leader key\n")
             leader_key = leader_setting.get("key", "Space")
             leader_mods = leader_setting.get("mods", "CTRL|SHIFT")
             leader_timeout = leader_setting.get("timeout_milliseconds", 1000)
-            lines.append(
-                f'config.leader = {{ key = "{leader_key}", mods = "{leader_mods}", timeout_milliseconds = {leader_timeout} }}'
+            write(
+                f'config.leader = {{ key = "{leader_key}", mods = "{leader_mods}", timeout_milliseconds = {leader_timeout} }}\n'
+                "\n"
             )
-            lines.append("")
 
         # Export key bindings
         if ctec.key_bindings:
-            lines.append("-- Key bindings")
-            lines.append("config.keys = {")
+            entries = []
             for kb in ctec.key_bindings:
                 # Check for unsupported features and warn
                 if kb.key_sequence and kb.key_sequence != ["LEADER"]:
-                    ctec.add_warning(
+                    add_warning(
                         f"Keybinding with key sequence '{'>'.join(kb.key_sequence)}' cannot be "
                         "directly exported to WezTerm. Consider using WezTerm's key_tables and "
                         "LEADER modifier for similar functionality."
                     )
                     continue
                 if kb.scope and kb.scope != KeyBindingScope.APPLICATION:
-                    ctec.add_warning(
+                    add_warning(
                         f"Keybinding '{kb.key}' has scope '{kb.scope.value}' which is not supported "
                         "in WezTerm. It will be exported as a regular (application-scoped) binding."
                     )
                 if kb.mode:
-                    ctec.add_warning(
+                    add_warning(
                         f"Keybinding '{kb.key}' has mode restriction '{kb.mode}' which is not "
                         "supported in WezTerm. It will be exported without mode restrictions."
                     )
@@ -1234,20 +1258,19 @@ class WeztermAdapter(TerminalAdapter):
                 mods = "|".join(mod_list) if mod_list else "NONE"
 
                 # Format action with proper syntax
-                action_str = cls._format_action(kb.action, kb.action_param)
+                action_str = format_action(kb.action, kb.action_param)
 
-                lines.append(
-                    f'  {{ key = "{kb.key}", mods = "{mods}", action = {action_str} }},'
+                entries.append(
+                    f'  {{ key = "{kb.key}", mods = "{mods}", action = {action_str} }},\n'
                 )
-            lines.append("}")
-            lines.append("")
+            write(f"-- Key bindings\nconfig.keys = {{\n{''.join(entries)}}}\n\n")
 
         # Export key_tables (from terminal-specific settings)
+        key_tables_setting = wezterm_settings.get("key_tables")
         if key_tables_setting:
-            lines.append("-- Key tables")
-            lines.append("config.key_tables = {")
+            write("-- Key tables\nconfig.key_tables = {\n")
             for table_name, bindings in key_tables_setting.items():
-                lines.append(f"  {table_name} = {{")
+                write(f"  {table_name} = {{\n")
                 if isinstance(bindings, (list, dict)):
                     if isinstance(bindings, dict):
                         bindings = list(bindings.values())
@@ -1256,7 +1279,7 @@ class WeztermAdapter(TerminalAdapter):
                             key = binding.get("key", "")
                             action = binding.get("action", "")
                             if isinstance(action, ActionSpec):
-                                action_str = cls._format_action(
+                                action_str = format_action(
                                     action.name,
                                     str(action.args[0]) if action.args else None,
                                 )
@@ -1264,23 +1287,17 @@ class WeztermAdapter(TerminalAdapter):
                                 action_str = f'"{action}"'
                             else:
                                 action_str = str(action)
-                            lines.append(
-                                f'    {{ key = "{key}", action = {action_str} }},'
-                            )
-                lines.append("  },")
-            lines.append("}")
-            lines.append("")
+                            write(f'    {{ key = "{key}", action = {action_str} }},\n')
+                write("  },\n")
+            write("}\n\n")
 
         # Restore window_frame configuration
-        window_frame_setting = None
-        for setting in ctec.get_terminal_specific("wezterm"):
-            if setting.key == "window_frame":
-                window_frame_setting = setting.value
-                break
+        window_frame_setting = wezterm_settings.get("window_frame")
 
         if window_frame_setting and isinstance(window_frame_setting, dict):
-            lines.append("-- Window frame (fancy tab bar appearance)")
-            lines.append("config.window_frame = {")
+            write(
+                "-- Window frame (fancy tab bar appearance)\nconfig.window_frame = {\n"
+            )
             for wf_key, wf_value in window_frame_setting.items():
                 if wf_key == "font" and isinstance(wf_value, FontSpec):
                     # Handle font specification
@@ -1289,115 +1306,82 @@ class WeztermAdapter(TerminalAdapter):
                         font_opts.append(f'weight = "{wf_value.weight}"')
                     if font_opts:
                         opts_str = ", ".join(font_opts)
-                        lines.append(
-                            f'  font = wezterm.font("{wf_value.family}", {{ {opts_str} }}),'
+                        write(
+                            f'  font = wezterm.font("{wf_value.family}", {{ {opts_str} }}),\n'
                         )
                     else:
-                        lines.append(f'  font = wezterm.font("{wf_value.family}"),')
+                        write(f'  font = wezterm.font("{wf_value.family}"),\n')
                 elif isinstance(wf_value, str):
-                    lines.append(f'  {wf_key} = "{wf_value}",')
-                elif isinstance(wf_value, (int, float)):
-                    lines.append(f"  {wf_key} = {wf_value},")
+                    write(f'  {wf_key} = "{wf_value}",\n')
                 elif isinstance(wf_value, bool):
-                    lines.append(f"  {wf_key} = {str(wf_value).lower()},")
-            lines.append("}")
-            lines.append("")
+                    write(f"  {wf_key} = {_LUA_BOOL[wf_value]},\n")
+                elif isinstance(wf_value, (int, float)):
+                    write(f"  {wf_key} = {wf_value},\n")
+            write("}\n\n")
 
         # Restore multiplexer domain configurations
-        domain_types = [
-            "ssh_domains",
-            "unix_domains",
-            "tls_clients",
-            "tls_servers",
-            "exec_domains",
-        ]
-        for domain_type in domain_types:
-            domain_setting = None
-            for setting in ctec.get_terminal_specific("wezterm"):
-                if setting.key == domain_type:
-                    domain_setting = setting.value
-                    break
-
+        for domain_type in DOMAIN_TYPES:
+            domain_setting = wezterm_settings.get(domain_type)
             if domain_setting:
-                lines.append(f"-- {domain_type.replace('_', ' ').title()}")
-                lines.append(f"config.{domain_type} = {{")
+                write(
+                    f"-- {domain_type.replace('_', ' ').title()}\n"
+                    f"config.{domain_type} = {{\n"
+                )
                 # Handle both list and dict (Lua table) formats
                 domain_list = domain_setting
                 if isinstance(domain_setting, dict):
                     # Convert dict with numeric keys to list
-                    domain_list = [
-                        domain_setting[i]
-                        for i in sorted(domain_setting.keys())
-                        if isinstance(i, int)
-                    ]
+                    domain_list = cls._lua_array_values(domain_setting)
                     if not domain_list:
                         # If no numeric keys, treat it as a single entry
                         domain_list = [domain_setting]
 
                 for entry in domain_list:
                     if isinstance(entry, dict):
-                        lines.append("  {")
+                        write("  {\n")
                         for entry_key, entry_value in entry.items():
                             if isinstance(entry_value, str):
-                                lines.append(f'    {entry_key} = "{entry_value}",')
+                                write(f'    {entry_key} = "{entry_value}",\n')
                             elif isinstance(entry_value, bool):
-                                lines.append(
-                                    f"    {entry_key} = {str(entry_value).lower()},"
-                                )
+                                write(f"    {entry_key} = {_LUA_BOOL[entry_value]},\n")
                             elif isinstance(entry_value, (int, float)):
-                                lines.append(f"    {entry_key} = {entry_value},")
+                                write(f"    {entry_key} = {entry_value},\n")
                             elif isinstance(entry_value, (list, tuple)):
                                 # Handle array values
-                                arr_str = ", ".join(f'"{v}"' for v in entry_value)
-                                lines.append(f"    {entry_key} = {{ {arr_str} }},")
+                                arr_str = _lua_string_list(entry_value)
+                                write(f"    {entry_key} = {{ {arr_str} }},\n")
                             elif isinstance(entry_value, dict):
                                 # Handle nested table values (like ssh_option)
-                                lines.append(f"    {entry_key} = {{")
+                                write(f"    {entry_key} = {{\n")
                                 for sub_key, sub_value in entry_value.items():
                                     if isinstance(sub_value, str):
-                                        lines.append(
-                                            f'      {sub_key} = "{sub_value}",'
-                                        )
+                                        write(f'      {sub_key} = "{sub_value}",\n')
                                     elif isinstance(sub_value, bool):
-                                        lines.append(
-                                            f"      {sub_key} = {str(sub_value).lower()},"
+                                        write(
+                                            f"      {sub_key} = {_LUA_BOOL[sub_value]},\n"
                                         )
                                     elif isinstance(sub_value, (int, float)):
-                                        lines.append(f"      {sub_key} = {sub_value},")
-                                lines.append("    },")
-                        lines.append("  },")
-                lines.append("}")
-                lines.append("")
+                                        write(f"      {sub_key} = {sub_value},\n")
+                                write("    },\n")
+                        write("  },\n")
+                write("}\n\n")
 
         # Restore other terminal-specific settings
-        handled_keys = {
-            "leader",
-            "key_tables",
-            "font_harfbuzz_features",
-            "font_freetype_load_target",
-            "event_callbacks",
-            "window_frame",
-            "ssh_domains",
-            "unix_domains",
-            "tls_clients",
-            "tls_servers",
-            "exec_domains",
-        }
-        other_settings = []
-        for setting in ctec.get_terminal_specific("wezterm"):
-            if setting.key not in handled_keys:
-                other_settings.append(setting)
-
-        if other_settings:
-            lines.append("-- Terminal-specific settings")
-            for setting in other_settings:
-                value = setting.value
-                if isinstance(value, str):
-                    value = f'"{value}"'
-                elif isinstance(value, bool):
-                    value = str(value).lower()
-                lines.append(f"config.{setting.key} = {value}")
-            lines.append("")
+        wrote_header = False
+        for setting in wezterm_specific:
+            if setting.key in HANDLED_SETTING_KEYS:
+                continue
+            if not wrote_header:
+                write("-- Terminal-specific settings\n")
+                wrote_header = True
+            value = setting.value
+            if isinstance(value, str):
+                value = f'"{value}"'
+            elif isinstance(value, bool):
+                value = _LUA_BOOL[value]
+            write(f"config.{setting.key} = {value}\n")
+        if wrote_header:
+            write("\n")
 
         # Export text hints as hyperlink_rules
         if ctec.text_hints and ctec.text_hints.rules:
@@ -1409,26 +1393,17 @@ class WeztermAdapter(TerminalAdapter):
             for rule in ctec.text_hints.rules:
                 if rule.regex:
                     # Check if this rule can be expressed as a hyperlink
-                    if (
-                        rule.action
-                        in (
-                            TextHintAction.OPEN,
-                            TextHintAction.OPEN_URL,
-                            TextHintAction.OPEN_FILE,
-                            None,
-                        )
-                        or rule.hyperlinks
-                    ):
+                    if rule.action in HYPERLINK_ACTIONS or rule.hyperlinks:
                         exportable_rules.append(rule)
                     else:
                         non_exportable_count += 1
 
             if exportable_rules:
-                lines.append("-- Hyperlink rules (from text hints)")
-                lines.append(
-                    "config.hyperlink_rules = wezterm.default_hyperlink_rules()"
+                write(
+                    "-- Hyperlink rules (from text hints)\n"
+                    "config.hyperlink_rules = wezterm.default_hyperlink_rules()\n"
+                    "\n"
                 )
-                lines.append("")
                 for rule in exportable_rules:
                     # Determine the format string
                     if rule.parameter:
@@ -1442,19 +1417,21 @@ class WeztermAdapter(TerminalAdapter):
                         url_format = "$0"
 
                     # Escape the regex for Lua bracket notation
-                    lua_regex = rule.regex.replace("\\", "\\\\")
-                    lines.append("table.insert(config.hyperlink_rules, {")
-                    lines.append(f"  regex = [[{lua_regex}]],")
-                    lines.append(f'  format = "{url_format}",')
-                    lines.append("})")
-                lines.append("")
+                    lua_regex = rule.regex.translate(_LUA_REGEX_ESCAPES)
+                    write(
+                        "table.insert(config.hyperlink_rules, {\n"
+                        f"  regex = [[{lua_regex}]],\n"
+                        f'  format = "{url_format}",\n'
+                        "})\n"
+                    )
+                write("\n")
 
             if non_exportable_count > 0:
-                ctec.add_warning(
+                add_warning(
                     f"WezTerm hyperlink_rules only support URL actions. "
                     f"{non_exportable_count} rule(s) with Copy/Paste/other actions "
                     "could not be exported."
                 )
 
-        lines.append("return config")
-        return "\n".join(lines)
+        write("return config")
+        return buf.getvalue()
@@ -6,22 +6,24 @@ config files with a mock wezterm module that captures all configuration
 settings.
 """
 
-from dataclasses import dataclass, field
+import threading
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
 from typing import Any
 
-from lupa import LuaRuntime  # type: ignore[import-untyped]
+from lupa import LuaError, LuaRuntime  # type: ignore[import-untyped]
 
 
-@dataclass
+@dataclass(slots=True)
 class FontSpec:
     """Captured font specification from wezterm.font() or font_with_fallback()."""
 
     family: str | None = None
     weight: str | None = None
     style: str | None = None
-    fallbacks: list[str] = field(default_factory=list)
+    fallbacks: tuple[str, ...] = ()
     # HarfBuzz features like {'calt=0', 'liga=0'}
-    harfbuzz_features: list[str] = field(default_factory=list)
+    harfbuzz_features: tuple[str, ...] = ()
     # FreeType settings
     freetype_load_target: str | None = None
     freetype_render_target: str | None = None
@@ -30,7 +32,7 @@ class FontSpec:
         return f"FontSpec(family={self.family!r}, weight={self.weight!r}, fallbacks={self.fallbacks!r})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionSpec:
     """Captured action specification from wezterm.action.*."""
 
@@ -41,7 +43,7 @@ class ActionSpec:
         return f"ActionSpec({self.name!r}, args={self.args!r})"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventCallback:
     """Captured wezterm.on() event callback."""
 
@@ -53,26 +55,6 @@ class EventCallback:
         return f"EventCallback({self.event_name!r})"
 
 
-class MockWeztermAction:
-    """
-    Mock for wezterm.action namespace.
-
-    Captures action calls like wezterm.action.CopyTo("Clipboard").
-    """
-
-    def __getattr__(self, name: str):
-        """Return a callable that creates ActionSpec for any action name."""
-
-        def action_factory(*args: Any) -> ActionSpec:
-            return ActionSpec(name=name, args=args)
-
-        return action_factory
-
-    def __getitem__(self, name: str):
-        """Support Lua-style indexing (action[name])."""
-        return self.__getattr__(name)
-
-
 class MockWeztermColor:
     """Mock for wezterm.color namespace."""
 
@@ -95,6 +77,25 @@ class ConfigCapture(dict):
     pass
 
 
+# Font options copied verbatim onto FontSpec
+_FONT_STR_KEYS = frozenset(
+    {"weight", "style", "freetype_load_target", "freetype_render_target"}
+)
+
+
+def _apply_font_options(spec: FontSpec, opts: dict) -> None:
+    """Copy the font options WezTerm understands from a converted table."""
+    for key, value in opts.items():
+        if key in _FONT_STR_KEYS:
+            setattr(spec, key, value)
+        elif key == "harfbuzz_features" and value:
+            if isinstance(value, (list, tuple)):
+                spec.harfbuzz_features = tuple(value)
+            elif isinstance(value, dict):
+                # Lua table with numeric keys
+                spec.harfbuzz_features = tuple(value.values())
+
+
 class MockWezterm:
     """
     Mock wezterm module that captures configuration calls.
@@ -104,10 +105,10 @@ class MockWezterm:
     """
 
     def __init__(self) -> None:
-        self.action = MockWeztermAction()
         self.color = MockWeztermColor()
         self._font_calls: list[FontSpec] = []
-        self._event_callbacks: list[EventCallback] = []
+        # Keyed by event name, so repeated on() calls share one entry
+        self._event_callbacks: dict[str, EventCallback] = {}
 
     def config_builder(self) -> ConfigCapture:
         """Return a config object that captures all assignments."""
@@ -117,22 +118,10 @@ class MockWezterm:
         """Capture a font() call."""
         spec = FontSpec(family=family)
         if opts:
-            # opts is a Lua table, convert to dict if needed
-            opts_dict = _lua_value_to_python(opts) if hasattr(opts, "items") else opts
+            # opts is usually a Lua table; convert it once up front
+            opts_dict = _deep_convert_lua_values(opts)
             if isinstance(opts_dict, dict):
-                spec.weight = opts_dict.get("weight")
-                spec.style = opts_dict.get("style")
-                # Capture HarfBuzz features
-                hb = opts_dict.get("harfbuzz_features")
-                if hb:
-                    if isinstance(hb, (list, tuple)):
-                        spec.harfbuzz_features = list(hb)
-                    elif isinstance(hb, dict):
-                        # Lua table with numeric keys
-                        spec.harfbuzz_features = list(hb.values())
-                # Capture FreeType settings
-                spec.freetype_load_target = opts_dict.get("freetype_load_target")
-                spec.freetype_render_target = opts_dict.get("freetype_render_target")
+                _apply_font_options(spec, opts_dict)
         self._font_calls.append(spec)
         return spec
 
@@ -141,37 +130,35 @@ class MockWezterm:
         spec = FontSpec()
 
         # Convert Lua table to Python list
-        font_list = _lua_table_to_list(fonts)
+        font_list = _deep_convert_lua_values(fonts, expect="list")
+        fallbacks = []
 
         for i, font_entry in enumerate(font_list):
             if isinstance(font_entry, dict):
                 # Table entry like { family = "Name", weight = "Bold" }
                 if i == 0:
                     spec.family = font_entry.get("family")
-                    spec.weight = font_entry.get("weight")
-                    spec.style = font_entry.get("style")
-                    # Capture HarfBuzz features from primary font
-                    hb = font_entry.get("harfbuzz_features")
-                    if hb:
-                        if isinstance(hb, (list, tuple)):
-                            spec.harfbuzz_features = list(hb)
-                        elif isinstance(hb, dict):
-                            spec.harfbuzz_features = list(hb.values())
-                    spec.freetype_load_target = font_entry.get("freetype_load_target")
-                    spec.freetype_render_target = font_entry.get(
-                        "freetype_render_target"
-                    )
+                    _apply_font_options(spec, font_entry)
                 else:
                     # Fallback with weight - just use the family name
                     if font_entry.get("family"):
-                        spec.fallbacks.append(font_entry["family"])
+                        fallbacks.append(font_entry["family"])
             elif isinstance(font_entry, str):
                 # Simple string entry
                 if i == 0:
                     spec.family = font_entry
                 else:
-                    spec.fallbacks.append(font_entry)
+                    fallbacks.append(font_entry)
 
+        spec.fallbacks = tuple(fallbacks)
+        self._font_calls.append(spec)
+        return spec
+
+    def font_with_fallback_names(self, *families: str) -> FontSpec:
+        """Capture a font_with_fallback() call listing only family names."""
+        spec = FontSpec(
+            family=families[0] if families else None, fallbacks=families[1:]
+        )
         self._font_calls.append(spec)
         return spec
 
@@ -181,127 +168,138 @@ class MockWezterm:
 
     def on(self, event_name: str, callback: Any = None) -> None:
         """Capture wezterm.on() event registration."""
-        self._event_callbacks.append(EventCallback(event_name=event_name))
+        if event_name not in self._event_callbacks:
+            self._event_callbacks[event_name] = EventCallback(event_name=event_name)
 
     def get_builtin_color_schemes(self) -> dict:
         """Return empty dict - we don't have access to actual schemes."""
         return {}
 
 
-def _lua_table_to_list(lua_table: Any) -> list:
-    """Convert a Lua table (with numeric keys) to a Python list."""
-    if isinstance(lua_table, (list, tuple)):
-        return [_lua_value_to_python(v) for v in lua_table]
-
-    # Try to iterate over numeric keys starting at 1 (Lua convention)
-    result = []
-    try:
-        i = 1
-        while True:
-            val = lua_table[i]
-            if val is None:
-                break
-            result.append(_lua_value_to_python(val))
-            i += 1
-    except (KeyError, TypeError, IndexError):
-        pass
+# Values that never need conversion and can be copied straight into the output
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
-    return result
 
+# Key marking the tables built by the Lua-side wezterm.action namespace
+_ACTION_MARKER = "__action"
 
-def _lua_value_to_python(value: Any) -> Any:
-    """Recursively convert Lua values to Python equivalents."""
-    if value is None:
-        return None
 
-    # Check for lupa table type
-    if hasattr(value, "items"):
-        # Check if it's array-like (consecutive integer keys starting at 1)
-        is_array = True
-        max_key = 0
-        for k in value.keys():
-            if isinstance(k, int) and k > 0:
-                max_key = max(max_key, k)
-            else:
-                is_array = False
-                break
-
-        if is_array and max_key > 0:
-            # Check consecutive
-            try:
-                for i in range(1, max_key + 1):
-                    _ = value[i]
-            except (KeyError, TypeError):
-                is_array = False
-
-        if is_array and max_key > 0:
-            return [_lua_value_to_python(value[i]) for i in range(1, max_key + 1)]
-        else:
-            return {
-                _lua_value_to_python(k): _lua_value_to_python(v)
-                for k, v in value.items()
-            }
+def _action_from_lua(name: str, args: Any) -> ActionSpec:
+    """Build an ActionSpec from an action table created in Lua."""
+    converted = _deep_convert_lua_values(args) if args is not None else []
+    if isinstance(converted, dict):
+        # Empty argument lists, or ones with nil holes, come back as dicts
+        converted = [converted.get(i) for i in range(1, max(converted, default=0) + 1)]
+    return ActionSpec(name=name, args=tuple(converted))
 
-    # Handle our custom types
-    if isinstance(value, (FontSpec, ActionSpec, EventCallback)):
-        return value
-
-    # Primitives
-    return value
-
-
-def _lua_table_to_dict(lua_table: Any) -> dict:
-    """Convert a Lua table to a Python dict, recursively."""
-    if isinstance(lua_table, dict):
-        return lua_table
 
-    result = {}
-    if hasattr(lua_table, "items"):
-        for k, v in lua_table.items():
-            result[k] = _lua_value_to_python(v)
-    return result
+def _deep_convert_lua_values(value: Any, expect: str | None = None) -> Any:
+    """
+    Recursively convert all Lua tables in a value to Python types.
 
+    The tree is walked with an explicit stack rather than Python recursion,
+    so deeply nested tables can't hit the recursion limit. Each table is
+    read once and classified as an array or a dict from that single pass.
 
-def _deep_convert_lua_values(value: Any) -> Any:
-    """Recursively convert all Lua tables in a value to Python types."""
-    if value is None:
-        return None
+    With expect="list", the top-level value is always returned as a list:
+    the integer-keyed entries, in key order, of a table that isn't a plain
+    array, or an empty list for anything that isn't a table.
+    """
+    root = [None]
+    stack = [(root, 0, value)]
+    while stack:
+        parent, key, item = stack.pop()
+
+        # Lua tables (and Python dicts, which shouldn't occur but are safe)
+        if hasattr(item, "items"):
+            entries = list(item.items())
+
+            # Distinct positive integer keys are consecutive from 1 exactly
+            # when the largest one equals their count
+            max_key = 0
+            for k, _ in entries:
+                if type(k) is not int or k < 1:
+                    max_key = -1
+                    break
+                if k > max_key:
+                    max_key = k
+
+            if entries and max_key == len(entries):
+                # It's an array
+                out: Any = [None] * max_key
+                for k, v in entries:
+                    if type(v) in _SCALAR_TYPES:
+                        out[k - 1] = v
+                    else:
+                        stack.append((out, k - 1, v))
+            else:
+                # It's a dict; keys are inserted up front to keep their order
+                out = dict(entries)
+                action_name = out.get(_ACTION_MARKER)
+                if action_name is not None:
+                    out = _action_from_lua(action_name, out.get("args"))
+                else:
+                    for k, v in entries:
+                        if type(v) not in _SCALAR_TYPES:
+                            stack.append((out, k, v))
+
+        # Python lists and tuples both become lists
+        elif isinstance(item, (list, tuple)):
+            out = list(item)
+            for i, v in enumerate(out):
+                if type(v) not in _SCALAR_TYPES:
+                    stack.append((out, i, v))
+
+        # Primitives and our custom types are kept as-is
+        else:
+            out = item
 
-    # Check for lupa table type
-    if hasattr(value, "items") and hasattr(value, "keys"):
-        # Check if it's array-like (consecutive integer keys starting at 1)
-        keys = list(value.keys())
-        int_keys = [k for k in keys if isinstance(k, int) and k > 0]
+        parent[key] = out
 
-        if int_keys and len(int_keys) == len(keys):
-            # Check if consecutive from 1
-            max_key = max(int_keys)
-            if set(int_keys) == set(range(1, max_key + 1)):
-                # It's an array
-                return [
-                    _deep_convert_lua_values(value[i]) for i in range(1, max_key + 1)
-                ]
+    result = root[0]
+    if expect == "list" and not isinstance(result, list):
+        if not isinstance(result, dict):
+            return []
+        return [result[k] for k in sorted(k for k in result if type(k) is int)]
+    return result
 
-        # It's a dict
-        return {k: _deep_convert_lua_values(v) for k, v in value.items()}
 
-    # Handle our custom types - keep them as-is
-    if isinstance(value, (FontSpec, ActionSpec, EventCallback)):
-        return value
+# Config settings WezTerm only accepts as arrays
+_CONFIG_LIST_KEYS = frozenset(
+    {
+        "keys",
+        "mouse_bindings",
+        "hyperlink_rules",
+        "launch_menu",
+        "font_dirs",
+        "ssh_domains",
+        "unix_domains",
+        "tls_clients",
+        "tls_servers",
+        "exec_domains",
+        "wsl_domains",
+    }
+)
 
-    # Handle Python dicts (shouldn't happen but be safe)
-    if isinstance(value, dict):
-        return {k: _deep_convert_lua_values(v) for k, v in value.items()}
 
-    # Handle Python lists
-    if isinstance(value, (list, tuple)):
-        return [_deep_convert_lua_values(item) for item in value]
+def _convert_config(config: Any) -> Any:
+    """
+    Convert the table a WezTerm config returned to Python types.
 
-    # Primitives
-    return value
+    Settings in _CONFIG_LIST_KEYS always come back as lists, so an empty
+    or sparse table doesn't surface as a dict.
+    """
+    if not hasattr(config, "items"):
+        return _deep_convert_lua_values(config)
+    return {
+        key: _deep_convert_lua_values(
+            value, expect="list" if key in _CONFIG_LIST_KEYS else None
+        )
+        for key, value in config.items()
+    }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeztermConfigResult:
     """Result of executing a WezTerm config, with metadata."""
 
@@ -309,10 +307,36 @@ class WeztermConfigResult:
     event_callbacks: list[EventCallback]
 
 
+def _copy_config(value: Any) -> Any:
+    """
+    Copy the containers of a cached config so callers can't mutate the cache.
+
+    Leaf values (strings, numbers, Lua function handles) are shared.
+    """
+    if isinstance(value, dict):
+        return {k: _copy_config(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_config(v) for v in value)
+    if isinstance(value, (FontSpec, ActionSpec, EventCallback)):
+        return replace(
+            value,
+            **{f.name: _copy_config(getattr(value, f.name)) for f in fields(value)},
+        )
+    return value
+
+
 def execute_wezterm_config(lua_source: str) -> dict[str, Any]:
     """
     Execute a WezTerm Lua config and return the captured configuration.
 
+    Results are memoized by source text, on the assumption that the same
+    config evaluates to the same settings within one process. Repeated
+    parses (round-trips, bulk conversions) skip the Lua runtime and receive
+    a fresh copy; a config that picks values with math.random therefore
+    keeps its first result until the cache entry is evicted.
+
     The Lua environment is sandboxed to prevent arbitrary code execution.
     Only safe standard library functions are available (string, table, math),
     and dangerous functions (os.execute, io.*, loadfile, etc.) are blocked.
@@ -327,21 +351,58 @@ def execute_wezterm_config(lua_source: str) -> dict[str, Any]:
     Raises:
         ValueError: If the Lua code fails to execute or doesn't return config
     """
-    lua = LuaRuntime(unpack_returned_tuples=True)
-
-    # Create our mock wezterm module
-    mock_wezterm = MockWezterm()
-
-    # Set up the Lua environment with our mock
-    lua.globals()["_mock_wezterm"] = mock_wezterm
-    lua.globals()["_user_code"] = lua_source
-
-    # Create the wezterm module and sandboxed environment in Lua
-    # Uses load() with env parameter (Lua 5.2+) to restrict the user code's environment
-    setup_and_execute_code = """
-    local _mock = _mock_wezterm
-    local _user_code = _user_code
-
+    return _copy_config(_evaluate_wezterm_config(lua_source))
+
+
+# Lua chunk evaluated once per runtime. It returns a runner that builds a
+# fresh wezterm module and sandboxed environment for each config, so only
+# the config itself is parsed per call.
+_SANDBOX_BOOTSTRAP = """
+-- Shallow copy, so configs can't modify the library tables shared by runs
+local function copy(t)
+    local c = {}
+    for k, v in pairs(t) do
+        c[k] = v
+    end
+    return c
+end
+
+-- Hide the shared string metatable (and through it the string library)
+getmetatable("").__metatable = false
+
+-- Neither the bootstrap nor any sandbox uses I/O, OS, debug or module
+-- loading, so remove them from the runtime's globals entirely
+io, os, debug, package = nil, nil, nil, nil
+dofile, loadfile, require = nil, nil, nil
+
+-- Globals every sandbox starts from; they never change between runs
+local safe_globals = {
+    -- Safe standard functions
+    assert = assert,
+    error = error,
+    ipairs = ipairs,
+    next = next,
+    pairs = pairs,
+    pcall = pcall,
+    rawequal = rawequal,
+    rawget = rawget,
+    rawset = rawset,
+    select = select,
+    setmetatable = setmetatable,
+    getmetatable = getmetatable,
+    tonumber = tonumber,
+    tostring = tostring,
+    type = type,
+    xpcall = xpcall,
+
+    -- Version info
+    _VERSION = _VERSION,
+
+    -- Sandboxed print (no-op, but some configs may call it)
+    print = function() end,
+}
+
+return function(_user_code, _mock)
     -- Create the wezterm module table
     local wezterm = {}
 
@@ -355,8 +416,19 @@ def execute_wezterm_config(lua_source: str) -> dict[str, Any]:
         return _mock:font(family, opts)
     end
 
-    -- font_with_fallback captures fallback fonts
+    -- font_with_fallback captures fallback fonts. Plain lists of family
+    -- names are passed as arguments, skipping the table conversion.
     function wezterm.font_with_fallback(fonts)
+        if type(fonts) == "table" then
+            local n = 0
+            for _, entry in ipairs(fonts) do
+                if type(entry) ~= "string" then
+                    return _mock:font_with_fallback(fonts)
+                end
+                n = n + 1
+            end
+            return _mock:font_with_fallback_names(table.unpack(fonts, 1, n))
+        end
         return _mock:font_with_fallback(fonts)
     end
 
@@ -387,11 +459,15 @@ def execute_wezterm_config(lua_source: str) -> dict[str, Any]:
 
     -- Create the action namespace with a metatable for dynamic access
     wezterm.action = setmetatable({}, {
-        __index = function(_, name)
-            -- Return a function that creates an action
-            return function(...)
-                return _mock.action[name](...)
+        __index = function(t, name)
+            -- Return a function that creates an action, cached so later
+            -- references to the same action skip this lookup. Actions are
+            -- plain marked tables, turned into ActionSpec during conversion.
+            local fn = function(...)
+                return { __action = name, args = { ... } }
             end
+            rawset(t, name, fn)
+            return fn
         end
     })
 
@@ -400,47 +476,23 @@ def execute_wezterm_config(lua_source: str) -> dict[str, Any]:
 
     -- Create a sandboxed environment with only safe globals
     -- This prevents malicious configs from executing system commands
-    local safe_env = {
-        -- Safe standard functions
-        assert = assert,
-        error = error,
-        ipairs = ipairs,
-        next = next,
-        pairs = pairs,
-        pcall = pcall,
-        rawequal = rawequal,
-        rawget = rawget,
-        rawset = rawset,
-        select = select,
-        setmetatable = setmetatable,
-        getmetatable = getmetatable,
-        tonumber = tonumber,
-        tostring = tostring,
-        type = type,
-        xpcall = xpcall,
-
-        -- Safe standard libraries (pure functions, no I/O)
-        string = string,
-        table = table,
-        math = math,
-
-        -- Version info
-        _VERSION = _VERSION,
-
-        -- Our mock wezterm module
-        wezterm = wezterm,
-
-        -- Sandboxed require that only returns wezterm
-        require = function(name)
-            if name == "wezterm" then
-                return wezterm
-            end
-            error("require('" .. name .. "') is not available in sandboxed environment", 2)
-        end,
+    local safe_env = copy(safe_globals)
 
-        -- Sandboxed print (no-op, but some configs may call it)
-        print = function() end,
-    }
+    -- Safe standard libraries (pure functions, no I/O), copied per run
+    safe_env.string = copy(string)
+    safe_env.table = copy(table)
+    safe_env.math = copy(math)
+
+    -- Our mock wezterm module
+    safe_env.wezterm = wezterm
+
+    -- Sandboxed require that only returns wezterm
+    safe_env.require = function(name)
+        if name == "wezterm" then
+            return wezterm
+        end
+        error("require('" .. name .. "') is not available in sandboxed environment", 2)
+    end
 
     -- Allow safe_env to reference itself as _G
     safe_env._G = safe_env
@@ -454,22 +506,64 @@ def execute_wezterm_config(lua_source: str) -> dict[str, Any]:
 
     -- Execute and return the result
     return user_func()
-    """
+end
+"""
+
+# Lupa runtimes are not thread-safe; the lock serializes use of the shared one
+_runtime_lock = threading.Lock()
+_sandbox_runtime: Any = None
+_sandbox_runner: Any = None
+
+
+def _get_sandbox_runner() -> Any:
+    """Return the sandbox runner, creating the shared Lua runtime on first use."""
+    global _sandbox_runtime, _sandbox_runner
+    if _sandbox_runner is None:
+        # Configs never reach Python's eval or builtins, so don't expose them
+        _sandbox_runtime = LuaRuntime(
+            unpack_returned_tuples=True, register_eval=False, register_builtins=False
+        )
+        _sandbox_runner = _sandbox_runtime.execute(_SANDBOX_BOOTSTRAP)
+    return _sandbox_runner
 
-    try:
-        result = lua.execute(setup_and_execute_code)
-    except Exception as e:
-        raise ValueError(f"Failed to execute WezTerm config: {e}") from e
 
-    # The result should be the config table (from 'return config')
-    if result is None:
-        raise ValueError("WezTerm config did not return a config table")
+def _discard_sandbox_runner() -> None:
+    """Drop the shared runtime so the next config starts from a clean one."""
+    global _sandbox_runtime, _sandbox_runner
+    _sandbox_runtime = _sandbox_runner = None
+
+
+@lru_cache(maxsize=16)
+def _evaluate_wezterm_config(lua_source: str) -> dict[str, Any]:
+    """Run a WezTerm config in the shared sandboxed runtime (uncached)."""
+    # Create our mock wezterm module
+    mock_wezterm = MockWezterm()
 
-    # Convert all Lua tables to Python dicts/lists
-    config_dict = _deep_convert_lua_values(result)
+    with _runtime_lock:
+        try:
+            result = _get_sandbox_runner()(lua_source, mock_wezterm)
+        except LuaError as e:
+            raise ValueError(f"Failed to execute WezTerm config: {e}") from e
+        except Exception as e:
+            # Anything other than a Lua error may have left the runtime in a
+            # bad state; rebuild it for the next config
+            _discard_sandbox_runner()
+            raise ValueError(f"Failed to execute WezTerm config: {e}") from e
+
+        # The result should be the config table (from 'return config')
+        if result is None:
+            raise ValueError("WezTerm config did not return a config table")
+
+        # Convert all Lua tables to Python dicts/lists
+        config_dict = _convert_config(result)
+
+        # Everything the config built is garbage now; free it rather than
+        # leaving it resident in the long-lived runtime
+        del result
+        _sandbox_runtime.gccollect()
 
     # Add captured event callbacks as special key
     if mock_wezterm._event_callbacks:
-        config_dict["_wezterm_events"] = mock_wezterm._event_callbacks
+        config_dict["_wezterm_events"] = list(mock_wezterm._event_callbacks.values())
 
     return config_dict
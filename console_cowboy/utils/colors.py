@@ -10,9 +10,69 @@ Different terminal emulators use different color representations:
 This module provides utilities for converting between these formats.
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
 from console_cowboy.ctec.schema import Color
 
 
+@lru_cache(maxsize=256)
+def _hex_components(hex_str: str) -> tuple[int, int, int]:
+    """Parse a hex color string to RGB components, memoized across calls."""
+    color = Color.from_hex(hex_str)
+    return color.r, color.g, color.b
+
+
+def _from_str(value: str) -> Color:
+    """Parse a hex color string."""
+    return Color(*_hex_components(value))
+
+
+def _from_dict(value: dict) -> Color:
+    """Parse a dict with r,g,b or red,green,blue keys."""
+    if "r" in value and "g" in value and "b" in value:
+        return Color(r=int(value["r"]), g=int(value["g"]), b=int(value["b"]))
+    if "red" in value and "green" in value and "blue" in value:
+        # Handle float values (0.0-1.0)
+        r = value["red"]
+        g = value["green"]
+        b = value["blue"]
+        if isinstance(r, float) and r <= 1.0:
+            return Color(r=int(r * 255), g=int(g * 255), b=int(b * 255))
+        return Color(r=int(r), g=int(g), b=int(b))
+    raise ValueError(f"Dict must have r,g,b or red,green,blue keys: {value}")
+
+
+def _from_sequence(value: tuple | list) -> Color:
+    """Parse a tuple or list of at least three components."""
+    if len(value) < 3:
+        raise ValueError(f"Color tuple must have at least 3 values: {value}")
+    r, g, b = value[0], value[1], value[2]
+    # Plain ints are the most common input and need no coercion
+    if type(r) is int and type(g) is int and type(b) is int:
+        return Color(r=r, g=g, b=b)
+    # Scale only when every component is a float in the 0-1 range
+    if all(isinstance(v, float) and 0.0 <= v <= 1.0 for v in (r, g, b)):
+        return Color(r=int(r * 255), g=int(g * 255), b=int(b * 255))
+    return Color(r=int(r), g=int(g), b=int(b))
+
+
+def _from_color(value: Color) -> Color:
+    """Pass an existing Color through unchanged."""
+    return value
+
+
+# Parsers keyed by exact input type; subclasses go through isinstance checks
+_PARSERS: dict[type, Callable[[Any], Color]] = {
+    str: _from_str,
+    dict: _from_dict,
+    tuple: _from_sequence,
+    list: _from_sequence,
+    Color: _from_color,
+}
+
+
 def normalize_color(value: str | dict | tuple | list | Color) -> Color:
     """
     Normalize a color value from various formats to a Color object.
@@ -31,33 +91,18 @@ def normalize_color(value: str | dict | tuple | list | Color) -> Color:
     Raises:
         ValueError: If the color format is not recognized
     """
+    parser = _PARSERS.get(type(value))
+    if parser is not None:
+        return parser(value)
+
     if isinstance(value, Color):
         return value
-
     if isinstance(value, str):
-        return Color.from_hex(value)
-
+        return _from_str(value)
     if isinstance(value, dict):
-        if "r" in value and "g" in value and "b" in value:
-            return Color(r=int(value["r"]), g=int(value["g"]), b=int(value["b"]))
-        if "red" in value and "green" in value and "blue" in value:
-            # Handle float values (0.0-1.0)
-            r = value["red"]
-            g = value["green"]
-            b = value["blue"]
-            if isinstance(r, float) and r <= 1.0:
-                return Color(r=int(r * 255), g=int(g * 255), b=int(b * 255))
-            return Color(r=int(r), g=int(g), b=int(b))
-        raise ValueError(f"Dict must have r,g,b or red,green,blue keys: {value}")
-
+        return _from_dict(value)
     if isinstance(value, (tuple, list)):
-        if len(value) < 3:
-            raise ValueError(f"Color tuple must have at least 3 values: {value}")
-        r, g, b = value[0], value[1], value[2]
-        # Check if values are floats in 0-1 range
-        if all(isinstance(v, float) and 0.0 <= v <= 1.0 for v in (r, g, b)):
-            return Color(r=int(r * 255), g=int(g * 255), b=int(b * 255))
-        return Color(r=int(r), g=int(g), b=int(b))
+        return _from_sequence(value)
 
     raise ValueError(f"Unsupported color format: {type(value)}")
 
@@ -4,12 +4,15 @@ Font registry for system font detection and validation.
 Provides platform-specific font enumeration without heavy dependencies.
 Uses:
 - macOS: CoreText via PyObjC (optional) or fallback to fc-list
-- Linux: fontconfig (fc-list command)
+- Linux: fontconfig (libfontconfig via ctypes, or the fc-list command)
 - Windows: Registry enumeration
 
 If fonttools is available, provides enhanced font file analysis.
 """
 
+import heapq
+import json
+import os
 import platform
 import re
 import subprocess
@@ -47,6 +50,48 @@ class FontInfo:
         indicators = [" Nerd Font", " NF", "-NF"]
         return any(ind in self.family for ind in indicators)
 
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "family": self.family,
+            "postscript_name": self.postscript_name,
+            "style": self.style,
+            "weight": self.weight,
+            "is_monospace": self.is_monospace,
+            "file_path": str(self.file_path) if self.file_path else None,
+            "format": self.format.value if self.format else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FontInfo":
+        """Create a FontInfo from a dictionary produced by to_dict()."""
+        return cls(
+            family=data["family"],
+            postscript_name=data.get("postscript_name"),
+            style=data.get("style", "Regular"),
+            weight=data.get("weight", 400),
+            is_monospace=data.get("is_monospace", False),
+            file_path=Path(data["file_path"]) if data.get("file_path") else None,
+            format=FontFormat(data["format"]) if data.get("format") else None,
+        )
+
+
+# Style names fonts use for their upright, normal-weight face
+_REGULAR_STYLES = frozenset({"Regular", "Book", "Normal", "Roman"})
+
+# Style words that mark a face as heavier or more slanted than the regular one
+_EMPHASIS_STYLE_WORDS = ("Bold", "Black", "Heavy", "Italic", "Oblique")
+
+
+def _style_emphasis(style: str) -> int:
+    """Count how far a style name strays from the regular face."""
+    return sum(word in style for word in _EMPHASIS_STYLE_WORDS)
+
+
+def _ngrams(s: str, n: int = 3) -> frozenset[str]:
+    """Return the character n-grams of a normalized name."""
+    return frozenset(s[i : i + n] for i in range(len(s) - n + 1))
+
 
 @dataclass
 class FontRegistry:
@@ -73,13 +118,27 @@ class FontRegistry:
     )  # family -> set of full names
     _postscript_index: dict[str, str] = field(
         default_factory=dict
-    )  # postscript -> family
+    )  # postscript -> full name of that face
+    _family_ngrams: dict[str, frozenset[str]] = field(
+        default_factory=dict
+    )  # family -> trigrams, for fuzzy matching
+
+    def __post_init__(self) -> None:
+        # Indexes passed in directly (e.g. from the disk cache) need trigrams too
+        for family in self._family_index.keys() - self._family_ngrams.keys():
+            self._family_ngrams[family] = _ngrams(family)
 
     @classmethod
     def create(cls, refresh: bool = False) -> "FontRegistry":
         """Create and populate the font registry."""
         # Use cached version unless refresh requested
-        return _get_cached_registry() if not refresh else cls._build_registry()
+        if not refresh:
+            return _get_cached_registry()
+        registry = cls._build_registry()
+        key = _registry_cache_key()
+        if key is not None and registry.fonts:
+            _save_registry_cache(key, registry)
+        return registry
 
     @classmethod
     def _build_registry(cls) -> "FontRegistry":
@@ -119,17 +178,26 @@ class FontRegistry:
 
         # Try family index
         if normalized in self._family_index:
+            # Sort so the chosen face doesn't depend on set iteration order
+            full_names = sorted(self._family_index[normalized])
             # Return the Regular variant if available
-            for full_name in self._family_index[normalized]:
+            for full_name in full_names:
+                info = self.fonts.get(full_name)
+                if info is not None and info.style in _REGULAR_STYLES:
+                    return info
                 if "Regular" in full_name or full_name == normalized:
-                    return self.fonts.get(full_name)
-            # Otherwise return first match
-            return self.fonts.get(next(iter(self._family_index[normalized])))
+                    return info
+            # Otherwise prefer faces that aren't bold or slanted
+            faces = [self.fonts[n] for n in full_names if n in self.fonts]
+            if not faces:
+                return None
+            return min(
+                faces, key=lambda info: (_style_emphasis(info.style), info.style)
+            )
 
         # Try PostScript index
         if normalized in self._postscript_index:
-            family = self._postscript_index[normalized]
-            return self.get_font_info(family)
+            return self.fonts.get(self._postscript_index[normalized])
 
         return None
 
@@ -137,20 +205,33 @@ class FontRegistry:
         """Find fonts similar to the given name."""
         if not name:
             return []
-        # Strategy: fuzzy match on family names
-        normalized = self._normalize_name(name)
+        # Strategy: fuzzy match on family names (Jaccard similarity of
+        # trigrams, precomputed per family when fonts are added)
+        query_grams = _ngrams(self._normalize_name(name))
+        if not query_grams:
+            return []
+        threshold = 0.3  # Minimum score for relevance
+        query_size = len(query_grams)
         candidates = []
 
-        for family in self._family_index.keys():
-            score = self._similarity_score(normalized, family)
-            if score > 0.3:  # Threshold for relevance
+        for family, family_grams in self._family_ngrams.items():
+            # Jaccard similarity can't exceed smaller/larger set size, so
+            # families far longer or shorter than the query are skipped
+            # without computing the set operations
+            family_size = len(family_grams)
+            if min(query_size, family_size) <= threshold * max(query_size, family_size):
+                continue
+            score = len(query_grams & family_grams) / len(query_grams | family_grams)
+            if score > threshold:
                 candidates.append((self._get_display_name(family), score))
 
-        candidates.sort(key=lambda x: x[1], reverse=True)
+        # Only the best few are needed; twice the limit leaves room for the
+        # deduplication below
+        top = heapq.nlargest(limit * 2, candidates, key=lambda x: x[1])
         # Deduplicate
         seen = set()
         result = []
-        for name, _ in candidates:
+        for name, _ in top:
             if name not in seen:
                 seen.add(name)
                 result.append(name)
@@ -208,10 +289,7 @@ class FontRegistry:
         """Calculate similarity between two normalized names."""
 
         # Simple Jaccard similarity on character n-grams
-        def ngrams(s: str, n: int = 3) -> set[str]:
-            return {s[i : i + n] for i in range(len(s) - n + 1)}
-
-        a_grams, b_grams = ngrams(a), ngrams(b)
+        a_grams, b_grams = _ngrams(a), _ngrams(b)
         if not a_grams or not b_grams:
             return 0.0
         intersection = len(a_grams & b_grams)
@@ -260,7 +338,84 @@ class FontRegistry:
 
     def _enumerate_linux_fonts(self) -> None:
         """Enumerate fonts on Linux using fontconfig."""
-        self._enumerate_via_fc_list()
+        try:
+            self._enumerate_via_libfontconfig()
+        except (OSError, AttributeError):
+            # Library not installed or unusable; try the command-line tool
+            self._enumerate_via_fc_list()
+
+    def _enumerate_via_libfontconfig(self) -> None:
+        """Enumerate fonts by calling libfontconfig directly (no subprocess)."""
+        import ctypes
+        import ctypes.util
+
+        class FcFontSet(ctypes.Structure):
+            _fields_ = [
+                ("nfont", ctypes.c_int),
+                ("sfont", ctypes.c_int),
+                ("fonts", ctypes.POINTER(ctypes.c_void_p)),
+            ]
+
+        lib_name = ctypes.util.find_library("fontconfig")
+        if not lib_name:
+            raise OSError("libfontconfig not found")
+        fc = ctypes.CDLL(lib_name)
+
+        fc.FcInitLoadConfigAndFonts.restype = ctypes.c_void_p
+        fc.FcPatternCreate.restype = ctypes.c_void_p
+        fc.FcObjectSetCreate.restype = ctypes.c_void_p
+        fc.FcObjectSetAdd.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+        fc.FcFontList.restype = ctypes.POINTER(FcFontSet)
+        fc.FcFontList.argtypes = [ctypes.c_void_p] * 3
+        fc.FcPatternGetString.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.c_char_p),
+        ]
+        for name in (
+            "FcFontSetDestroy",
+            "FcObjectSetDestroy",
+            "FcPatternDestroy",
+            "FcConfigDestroy",
+        ):
+            getattr(fc, name).argtypes = [ctypes.c_void_p]
+
+        config = fc.FcInitLoadConfigAndFonts()
+        if not config:
+            raise OSError("fontconfig failed to initialize")
+        pattern = fc.FcPatternCreate()
+        object_set = fc.FcObjectSetCreate()
+        for obj in (b"family", b"postscriptname", b"style"):
+            fc.FcObjectSetAdd(object_set, obj)
+        font_set = fc.FcFontList(config, pattern, object_set)
+
+        def get_string(font: int, obj: bytes) -> str | None:
+            # Only the first value matters, as with fc-list's "family,alias"
+            value = ctypes.c_char_p()
+            if fc.FcPatternGetString(font, obj, 0, ctypes.byref(value)) != 0:
+                return None
+            return value.value.decode("utf-8", "replace") if value.value else None
+
+        try:
+            if font_set:
+                fonts = font_set.contents
+                for i in range(fonts.nfont):
+                    font = fonts.fonts[i]
+                    family = get_string(font, b"family")
+                    if family:
+                        info = FontInfo(
+                            family=family.strip(),
+                            postscript_name=get_string(font, b"postscriptname"),
+                            style=get_string(font, b"style") or "Regular",
+                        )
+                        self._add_font(info)
+        finally:
+            if font_set:
+                fc.FcFontSetDestroy(font_set)
+            fc.FcObjectSetDestroy(object_set)
+            fc.FcPatternDestroy(pattern)
+            fc.FcConfigDestroy(config)
 
     def _enumerate_via_fc_list(self) -> None:
         """Enumerate fonts using fc-list command."""
@@ -322,17 +477,117 @@ class FontRegistry:
         normalized = self._normalize_name(info.family)
         if normalized not in self._family_index:
             self._family_index[normalized] = set()
+            self._family_ngrams[normalized] = _ngrams(normalized)
         self._family_index[normalized].add(key)
 
         if info.postscript_name:
             ps_normalized = self._normalize_name(info.postscript_name)
-            self._postscript_index[ps_normalized] = info.family
+            self._postscript_index[ps_normalized] = key
+
+
+# Bump when the cache file layout changes
+_CACHE_VERSION = 2
+
+# Directories whose modification times change when fonts are installed,
+# removed, or re-indexed by fontconfig
+_FONT_DIRS = (
+    "~/.fontconfig",
+    "~/.fonts",
+    "~/.local/share/fonts",
+    "~/.cache/fontconfig",
+    "~/Library/Fonts",
+    "/etc/fonts",
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "/var/cache/fontconfig",
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "%WINDIR%\\Fonts",
+    "%LOCALAPPDATA%\\Microsoft\\Windows\\Fonts",
+)
+
+
+def _registry_cache_path() -> Path:
+    """Return the location of the on-disk font registry cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "console-cowboy" / "fonts.json"
+
+
+def _registry_cache_key() -> list | None:
+    """
+    Describe the installed fonts cheaply enough to check on every start.
+
+    Returns None when none of the known font directories exist, since the
+    cache could then never notice fonts being installed or removed.
+    """
+    dir_mtimes = []
+    for font_dir in _FONT_DIRS:
+        try:
+            path = os.path.expandvars(os.path.expanduser(font_dir))
+            dir_mtimes.append([font_dir, os.stat(path).st_mtime_ns])
+        except OSError:
+            continue
+    if not dir_mtimes:
+        return None
+    return [_CACHE_VERSION, platform.system(), *dir_mtimes]
+
+
+def _load_registry_cache(key: list) -> FontRegistry | None:
+    """Load the cached registry if it was built for the same font state."""
+    try:
+        with _registry_cache_path().open(encoding="utf-8") as f:
+            data = json.load(f)
+        if data["key"] != key:
+            return None
+        return FontRegistry(
+            fonts={k: FontInfo.from_dict(v) for k, v in data["fonts"].items()},
+            _family_index={k: set(v) for k, v in data["family_index"].items()},
+            _postscript_index=dict(data["postscript_index"]),
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_registry_cache(key: list, registry: FontRegistry) -> None:
+    """Write the registry to the on-disk cache, ignoring failures."""
+    data = {
+        "key": key,
+        "fonts": {k: info.to_dict() for k, info in registry.fonts.items()},
+        "family_index": {k: sorted(v) for k, v in registry._family_index.items()},
+        "postscript_index": registry._postscript_index,
+    }
+    path = _registry_cache_path()
+    # Write to a temporary file first so readers never see a partial cache
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
 
 
 @lru_cache(maxsize=1)
 def _get_cached_registry() -> FontRegistry:
-    """Get cached font registry."""
-    return FontRegistry._build_registry()
+    """
+    Get cached font registry.
+
+    Enumerating system fonts can take seconds, so the result is also kept
+    on disk and reused by later processes until the font directories change.
+    """
+    key = _registry_cache_key()
+    registry = _load_registry_cache(key) if key is not None else None
+    if registry is None:
+        registry = FontRegistry._build_registry()
+        # An empty registry usually means enumeration isn't available here,
+        # which is already fast to find out again
+        if key is not None and registry.fonts:
+            _save_registry_cache(key, registry)
+    return registry
 
 
 # Convenience functions
@@ -16,6 +16,10 @@ back to heuristics when the font isn't installed or on unsupported platforms.
 import re
 import subprocess
 import sys
+from functools import lru_cache
+from typing import Any
+
+from .font_registry import FontRegistry
 
 
 def _get_system_font_names(font_name: str) -> tuple[str, str] | None:
@@ -29,13 +33,42 @@ def _get_system_font_names(font_name: str) -> tuple[str, str] | None:
         Tuple of (friendly_name, postscript_name) or None if not found
     """
     if sys.platform == "darwin":
-        return _get_font_names_macos(font_name)
+        lookup = _get_font_names_macos
     elif sys.platform.startswith("linux"):
-        return _get_font_names_linux(font_name)
-    return None
+        lookup = _get_font_names_linux
+    else:
+        return None
+
+    # The registry enumerates every installed font in one sweep, so check it
+    # before spawning a per-font lookup process
+    info = FontRegistry.create().get_font_info(font_name)
+    if info is not None and info.postscript_name:
+        return (info.family, info.postscript_name)
+    return lookup(font_name)
+
+
+@lru_cache(maxsize=1)
+def _load_nsfont() -> Any:
+    """Return PyObjC's NSFont class, or None when PyObjC isn't installed."""
+    try:
+        from AppKit import NSFont
+    except ImportError:
+        return None
+    return NSFont
 
 
 def _get_font_names_macos(font_name: str) -> tuple[str, str] | None:
+    """Query NSFont for font names on macOS, in-process when PyObjC is available."""
+    ns_font = _load_nsfont()
+    if ns_font is None:
+        return _get_font_names_osascript(font_name)
+    font = ns_font.fontWithName_size_(font_name, 12.0)
+    if font is None:
+        return None
+    return (str(font.familyName()), str(font.fontName()))
+
+
+def _get_font_names_osascript(font_name: str) -> tuple[str, str] | None:
     """Query NSFont for font names on macOS using JavaScript for Automation."""
     try:
         # Use JXA (JavaScript for Automation) to query NSFont
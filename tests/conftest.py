@@ -11,3 +11,9 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 def fixtures_dir():
     """Return the path to the fixtures directory."""
     return FIXTURES_DIR
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path, monkeypatch):
+    """Keep on-disk caches (such as the font registry) out of the real home."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -0,0 +1,47 @@
+"""Tests for color conversion utilities."""
+
+import pytest
+
+from console_cowboy.ctec.schema import Color
+from console_cowboy.utils.colors import normalize_color
+
+
+class TestNormalizeColor:
+    """Tests for normalize_color."""
+
+    def test_hex_string(self):
+        assert normalize_color("#ff8000") == Color(255, 128, 0)
+
+    def test_int_sequence(self):
+        assert normalize_color((255, 0, 0)) == Color(255, 0, 0)
+        assert normalize_color([0, 128, 255]) == Color(0, 128, 255)
+
+    def test_float_sequence(self):
+        assert normalize_color((1.0, 0.5, 0.0)) == Color(255, 127, 0)
+
+    def test_mixed_sequence_is_not_scaled(self):
+        """Only all-float sequences in 0.0-1.0 are scaled."""
+        assert normalize_color((1.0, 255, 255)) == Color(1, 255, 255)
+        assert normalize_color((0.5, 200, 100)) == Color(0, 200, 100)
+
+    def test_out_of_range_float_sequence_is_not_scaled(self):
+        assert normalize_color((0.5, 0.5, 2.0)) == Color(0, 0, 2)
+        assert normalize_color((-0.5, 0.5, 0.5)) == Color(0, 0, 0)
+
+    def test_short_sequence(self):
+        with pytest.raises(ValueError, match="at least 3 values"):
+            normalize_color((1, 2))
+
+    def test_dict_formats(self):
+        assert normalize_color({"r": 1, "g": 2, "b": 3}) == Color(1, 2, 3)
+        assert normalize_color({"red": 1.0, "green": 0.0, "blue": 0.5}) == Color(
+            255, 0, 127
+        )
+
+    def test_color_passthrough(self):
+        color = Color(1, 2, 3)
+        assert normalize_color(color) is color
+
+    def test_unsupported_type(self):
+        with pytest.raises(ValueError, match="Unsupported color format"):
+            normalize_color(42)
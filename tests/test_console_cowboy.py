@@ -242,6 +242,26 @@ class TestImportCommand:
         assert "wezterm" in result.output
         assert "return config" in result.output
 
+    def test_import_ctec_to_vscode_quiet(self, runner):
+        ctec_path = FIXTURES_DIR / "ctec" / "complete.yaml"
+        result = runner.invoke(
+            cli, ["import", "--from", str(ctec_path), "--to-type", "vscode", "--quiet"]
+        )
+
+        assert result.exit_code == 0
+        assert "terminal.integrated.fontFamily" in result.output
+        # --quiet also suppresses the VSCode merge instructions
+        assert "VSCode Export Notes" not in result.output
+
+    def test_import_ctec_to_vscode_shows_notes(self, runner):
+        ctec_path = FIXTURES_DIR / "ctec" / "complete.yaml"
+        result = runner.invoke(
+            cli, ["import", "--from", str(ctec_path), "--to-type", "vscode"]
+        )
+
+        assert result.exit_code == 0
+        assert "VSCode Export Notes" in result.output
+
     def test_import_ctec_to_iterm2(self, runner):
         ctec_path = FIXTURES_DIR / "ctec" / "complete.yaml"
         result = runner.invoke(
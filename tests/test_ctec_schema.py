@@ -515,6 +515,11 @@ class TestCTEC:
         ctec.add_warning("Test warning")
         assert "Test warning" in ctec.warnings
 
+    def test_add_warning_with_args(self):
+        ctec = CTEC()
+        ctec.add_warning("Invalid fontSize: %s", "big")
+        assert ctec.warnings == ["Invalid fontSize: big"]
+
     def test_add_terminal_specific(self):
         ctec = CTEC()
         ctec.add_terminal_specific("iterm2", "test_key", "test_value")
@@ -1,8 +1,15 @@
 """Tests for font registry and validation utilities."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 from console_cowboy.utils.font_registry import (
+    FontFormat,
     FontInfo,
     FontRegistry,
+    _load_registry_cache,
+    _registry_cache_key,
+    _save_registry_cache,
     find_similar_fonts,
     font_exists,
     validate_font,
@@ -109,6 +116,51 @@ class TestFontRegistry:
         assert retrieved is not None
         assert retrieved.family == "Test Font"
 
+    def test_get_font_info_prefers_book_style(self):
+        """Test that a Book face counts as the regular variant."""
+        registry = FontRegistry()
+        registry._add_font(FontInfo(family="Test Sans", style="Bold"))
+        registry._add_font(FontInfo(family="Test Sans", style="Book"))
+        registry._add_font(FontInfo(family="Test Sans", style="Oblique"))
+
+        assert registry.get_font_info("Test Sans").style == "Book"
+
+    def test_get_font_info_by_postscript_name(self):
+        """Test that a PostScript name resolves to that exact face."""
+        registry = FontRegistry()
+        registry._add_font(
+            FontInfo(family="Test Mono", postscript_name="TestMono", style="Regular")
+        )
+        registry._add_font(
+            FontInfo(family="Test Mono", postscript_name="TestMono-Bold", style="Bold")
+        )
+
+        info = registry.get_font_info("TestMono-Bold")
+        assert info is not None
+        assert info.postscript_name == "TestMono-Bold"
+        assert info.style == "Bold"
+
+    def test_get_font_info_without_regular_face(self):
+        """Test that the least bold or slanted face is picked consistently."""
+        styles = ["Black", "Bold Italic", "Light", "Bold"]
+        for order in (styles, styles[::-1]):
+            registry = FontRegistry()
+            for style in order:
+                registry._add_font(FontInfo(family="Test Sans", style=style))
+            assert registry.get_font_info("Test Sans").style == "Light"
+
+    def test_linux_enumeration_falls_back_to_fc_list(self):
+        """Test that fc-list is used when libfontconfig can't be loaded."""
+        registry = FontRegistry()
+        with (
+            patch.object(
+                FontRegistry, "_enumerate_via_libfontconfig", side_effect=OSError
+            ),
+            patch.object(FontRegistry, "_enumerate_via_fc_list") as fc_list,
+        ):
+            registry._enumerate_linux_fonts()
+        fc_list.assert_called_once()
+
     def test_find_similar_fonts(self):
         """Test finding similar fonts."""
         registry = FontRegistry()
@@ -123,6 +175,81 @@ class TestFontRegistry:
         assert any("JetBrains" in s for s in similar)
 
 
+class TestRegistryCache:
+    """Tests for the on-disk font registry cache."""
+
+    def test_font_info_dict_round_trip(self):
+        info = FontInfo(
+            family="Test Font",
+            postscript_name="TestFont-Bold",
+            style="Bold",
+            weight=700,
+            is_monospace=True,
+            file_path=Path("/fonts/TestFont-Bold.ttf"),
+            format=FontFormat.TTF,
+        )
+        assert FontInfo.from_dict(info.to_dict()) == info
+
+    def test_cache_round_trip(self):
+        registry = FontRegistry()
+        registry._add_font(FontInfo(family="Test Font", postscript_name="TestFont"))
+        registry._add_font(FontInfo(family="Test Font", style="Bold"))
+        _save_registry_cache(["key"], registry)
+
+        loaded = _load_registry_cache(["key"])
+        assert loaded is not None
+        assert loaded.fonts == registry.fonts
+        assert loaded._family_index == registry._family_index
+        assert loaded.get_font_info("TestFont").family == "Test Font"
+        assert loaded.find_similar_fonts("Test Fonts") == ["Test Font"]
+
+    def test_cache_ignored_when_key_changes(self):
+        registry = FontRegistry()
+        registry._add_font(FontInfo(family="Test Font"))
+        _save_registry_cache(["old"], registry)
+
+        assert _load_registry_cache(["new"]) is None
+
+    def test_missing_or_corrupt_cache(self, tmp_path):
+        assert _load_registry_cache(["key"]) is None
+
+        cache_file = tmp_path / "cache" / "console-cowboy" / "fonts.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+        assert _load_registry_cache(["key"]) is None
+
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        registry = FontRegistry()
+        registry._add_font(FontInfo(family="Test Font"))
+        with patch(
+            "console_cowboy.utils.font_registry.os.replace",
+            side_effect=OSError("disk full"),
+        ):
+            _save_registry_cache(["key"], registry)
+
+        cache_dir = tmp_path / "cache" / "console-cowboy"
+        assert list(cache_dir.iterdir()) == []
+
+    def test_font_dir_variables_expanded(self, tmp_path, monkeypatch):
+        fonts_dir = tmp_path / "Windows" / "Fonts"
+        fonts_dir.mkdir(parents=True)
+        monkeypatch.setenv("WINDIR", str(tmp_path / "Windows"))
+        with patch(
+            "console_cowboy.utils.font_registry._FONT_DIRS",
+            ("$WINDIR/Fonts",),
+        ):
+            key = _registry_cache_key()
+        assert key is not None
+        assert key[-1] == ["$WINDIR/Fonts", fonts_dir.stat().st_mtime_ns]
+
+    def test_no_cache_key_without_font_dirs(self, tmp_path):
+        with patch(
+            "console_cowboy.utils.font_registry._FONT_DIRS",
+            (str(tmp_path / "missing"),),
+        ):
+            assert _registry_cache_key() is None
+
+
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
@@ -1,8 +1,11 @@
 """Tests for font name conversion utilities."""
 
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from console_cowboy.utils.font_registry import FontInfo, FontRegistry
 from console_cowboy.utils.fonts import (
     _get_system_font_names,
     _postscript_to_friendly_heuristic,
@@ -361,16 +364,65 @@ class TestSystemFontLookup:
         assert "M+Code" in result
         assert "-Regular" not in result
 
+    def test_get_system_font_names_uses_registry(self):
+        """Test that installed fonts are resolved without a subprocess."""
+        registry = FontRegistry()
+        registry._add_font(
+            FontInfo(family="Registry Mono", postscript_name="RegistryMono-Regular")
+        )
+        with (
+            patch.object(FontRegistry, "create", return_value=registry),
+            patch("console_cowboy.utils.fonts.subprocess.run") as run,
+        ):
+            result = _get_system_font_names("RegistryMono-Regular")
+        assert result == ("Registry Mono", "RegistryMono-Regular")
+        run.assert_not_called()
+
     def test_get_system_font_names_unsupported_platform(self):
         """Test that unsupported platforms return None."""
-        with patch.object(sys, "platform", "win32"):
+        with (
+            patch.object(sys, "platform", "win32"),
+            patch("console_cowboy.utils.fonts.FontRegistry.create") as create,
+        ):
             result = _get_system_font_names("AnyFont")
             assert result is None
+            create.assert_not_called()
 
 
 class TestSystemFontLookupEdgeCases:
     """Tests for edge cases in system font lookup functions."""
 
+    @pytest.fixture(autouse=True)
+    def without_pyobjc(self):
+        """Exercise the osascript path even where PyObjC is installed."""
+        with patch("console_cowboy.utils.fonts._load_nsfont", return_value=None):
+            yield
+
+    def test_pyobjc_used_when_available(self):
+        """Test that NSFont is queried in-process instead of via osascript."""
+        ns_font = MagicMock()
+        font = ns_font.fontWithName_size_.return_value
+        font.familyName.return_value = "JetBrains Mono"
+        font.fontName.return_value = "JetBrainsMono-Regular"
+        with (
+            patch("console_cowboy.utils.fonts._load_nsfont", return_value=ns_font),
+            patch("console_cowboy.utils.fonts.subprocess.run") as run,
+        ):
+            from console_cowboy.utils.fonts import _get_font_names_macos
+
+            result = _get_font_names_macos("JetBrainsMono-Regular")
+        assert result == ("JetBrains Mono", "JetBrainsMono-Regular")
+        run.assert_not_called()
+
+    def test_pyobjc_font_not_found_returns_none(self):
+        """Test that a missing NSFont returns None without osascript."""
+        ns_font = MagicMock()
+        ns_font.fontWithName_size_.return_value = None
+        with patch("console_cowboy.utils.fonts._load_nsfont", return_value=ns_font):
+            from console_cowboy.utils.fonts import _get_font_names_macos
+
+            assert _get_font_names_macos("NonExistentFont-Regular") is None
+
     def test_fc_match_missing_returns_none(self):
         """Test that missing fc-match command returns None and falls back to heuristics."""
 
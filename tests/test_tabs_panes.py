@@ -336,3 +336,12 @@ focus_follows_mouse yes
         assert parsed.get_terminal_specific(
             "kitty", "inactive_border_color"
         ) == original.get_terminal_specific("kitty", "inactive_border_color")
+
+    def test_tab_and_pane_config_is_empty(self):
+        """Test is_empty reports whether any setting was configured."""
+        from console_cowboy.ctec.schema import PaneConfig, TabConfig
+
+        assert TabConfig().is_empty()
+        assert not TabConfig(show_index=False).is_empty()
+        assert PaneConfig().is_empty()
+        assert not PaneConfig(focus_follows_mouse=False).is_empty()
@@ -1,5 +1,6 @@
 """Tests for the terminal registry."""
 
+from console_cowboy.ctec.schema import CTEC
 from console_cowboy.terminals import (
     GhosttyAdapter,
     HyperAdapter,
@@ -43,3 +44,9 @@ class TestTerminalRegistry:
         assert VSCodeAdapter in terminals
         assert TerminalAppAdapter in terminals
         assert HyperAdapter in terminals
+
+    def test_every_adapter_export_accepts_quiet(self, capsys):
+        for adapter in TerminalRegistry.list_terminals():
+            output = adapter.export(CTEC(), quiet=True)
+            assert isinstance(output, str)
+        assert capsys.readouterr().err == ""
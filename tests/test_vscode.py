@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from console_cowboy.ctec.schema import (
     CTEC,
     Color,
@@ -61,6 +63,10 @@ class TestVSCodeAdapter:
         assert ctec.behavior is not None
         assert ctec.behavior.copy_on_select is True
 
+    def test_parse_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            VSCodeAdapter.parse(tmp_path / "missing.json")
+
     def test_parse_from_content(self):
         content = """
 {
@@ -117,6 +123,17 @@ class TestVSCodeAdapter:
         data = json.loads(output)
         assert isinstance(data, dict)
 
+    def test_export_prints_notes(self, capsys):
+        VSCodeAdapter.export(CTEC(font=FontConfig(family="Test Font")))
+        assert "VSCode Export Notes" in capsys.readouterr().err
+
+    def test_export_quiet(self, capsys):
+        output = VSCodeAdapter.export(
+            CTEC(font=FontConfig(family="Test Font")), quiet=True
+        )
+        assert "Test Font" in output
+        assert capsys.readouterr().err == ""
+
     def test_roundtrip(self):
         config_path = FIXTURES_DIR / "vscode" / "settings.json"
         original = VSCodeAdapter.parse(config_path)
@@ -141,6 +158,36 @@ class TestVSCodeAdapter:
         assert cursor_width is not None
         assert cursor_width.value == 2
 
+    def test_non_terminal_settings_ignored(self):
+        content = """
+{
+    "editor.fontSize": 12,
+    "terminal.integrated.fontSize": 15,
+    "terminal.integrated.gpuAcceleration": "on"
+}
+"""
+        ctec = VSCodeAdapter.parse("test.json", content=content)
+        assert ctec.font.size == 15.0
+        keys = [s.key for s in ctec.get_terminal_specific("vscode")]
+        assert keys == ["terminal.integrated.gpuAcceleration"]
+
+    def test_key_parsers_cover_recognized_keys(self):
+        parsers = VSCodeAdapter._get_key_parsers()
+        assert set(parsers) == {
+            "terminal.integrated.fontFamily",
+            "terminal.integrated.fontSize",
+            "terminal.integrated.fontWeight",
+            "terminal.integrated.lineHeight",
+            "terminal.integrated.letterSpacing",
+            "terminal.integrated.fontLigatures",
+            "terminal.integrated.cursorStyle",
+            "terminal.integrated.cursorBlinking",
+            "terminal.integrated.scrollback",
+            "terminal.integrated.copyOnSelection",
+            "terminal.integrated.confirmOnExit",
+            "workbench.colorCustomizations",
+        }
+
     def test_ghostty_to_vscode(self):
         """Test converting from Ghostty to VSCode."""
 
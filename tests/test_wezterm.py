@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from console_cowboy.ctec.schema import (
     CTEC,
     BehaviorConfig,
@@ -14,6 +16,7 @@ from console_cowboy.ctec.schema import (
     WindowConfig,
 )
 from console_cowboy.terminals import WeztermAdapter
+from console_cowboy.terminals.wezterm.lua import execute_wezterm_config
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -35,6 +38,128 @@ class TestWeztermAdapter:
         assert ctec.window.columns == 120
         assert ctec.window.rows == 40
 
+    def test_parse_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            WeztermAdapter.parse(tmp_path / "missing.lua")
+
+    def test_parse_without_return(self):
+        content = """
+local wezterm = require 'wezterm'
+local config = wezterm.config_builder()
+config.font_size = 12
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+        assert ctec.font is None
+        assert any("did not return a config table" in w for w in ctec.warnings)
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            ('error("bad font table")', ":1: bad font table"),
+            ("local config = {", ":1: unexpected symbol near <eof>"),
+            (
+                "local wezterm = require 'wezterm'\nwezterm.nonexistent()",
+                ":2: attempt to call a nil value",
+            ),
+        ],
+    )
+    def test_parse_failing_chunk_reports_lua_error(self, content, message):
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+        assert any(message in w for w in ctec.warnings)
+        assert not any("did not return a config table" in w for w in ctec.warnings)
+
+    def test_parse_numeric_strings_accepted_by_int(self):
+        content = """
+local config = {}
+config.tab_max_width = "1_000"
+config.initial_cols = " 120 "
+return config
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+        assert ctec.tabs.max_width == 1000
+        assert ctec.window.columns == 120
+
+    def test_parse_non_numeric_values(self):
+        content = """
+local config = {}
+config.initial_cols = "auto"
+config.initial_rows = "40"
+config.scrollback_lines = "lots"
+return config
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+        assert ctec.window.columns is None
+        assert ctec.window.rows == 40
+        assert ctec.scroll is None
+        assert "Invalid scrollback_lines: lots" in ctec.warnings
+
+    def test_execute_config_returns_independent_copies(self):
+        content = """
+local config = {}
+config.colors = { ansi = { "#000000", "#ff0000" } }
+return config
+"""
+        first = execute_wezterm_config(content)
+        first["colors"]["ansi"].append("#00ff00")
+        second = execute_wezterm_config(content)
+        assert second["colors"]["ansi"] == ["#000000", "#ff0000"]
+
+    def test_execute_config_isolated_between_runs(self):
+        execute_wezterm_config("string.upper = nil\nleaked = 1\nreturn {}")
+        result = execute_wezterm_config(
+            "return { upper = string.upper('x'), leaked = leaked }"
+        )
+        assert result == {"upper": "X"}
+
+    def test_execute_config_converts_nested_tables(self):
+        result = execute_wezterm_config(
+            "return { a = {1, 2, {3}}, m = {[1] = 'x', [3] = 'y'}, e = {} }"
+        )
+        assert result == {"a": [1, 2, [3]], "m": {1: "x", 3: "y"}, "e": {}}
+
+    def test_execute_config_list_settings_are_lists(self):
+        result = execute_wezterm_config(
+            "return { keys = {}, font_dirs = { [1] = 'a', [3] = 'b' }, colors = {} }"
+        )
+        assert result == {"keys": [], "font_dirs": ["a", "b"], "colors": {}}
+
+    def test_execute_config_converts_nested_actions(self):
+        result = execute_wezterm_config(
+            "local act = require('wezterm').action\n"
+            "return { a = act.Multiple { act.CopyTo 'Clipboard', act.Nop() } }"
+        )
+        action = result["a"]
+        assert action.name == "Multiple"
+        assert [(a.name, a.args) for a in action.args[0]] == [
+            ("CopyTo", ("Clipboard",)),
+            ("Nop", ()),
+        ]
+
+    def test_parse_keys_table_with_named_entries(self):
+        content = """
+local wezterm = require 'wezterm'
+local config = {}
+config.keys = {
+  { key = "t", mods = "CTRL", action = wezterm.action.SpawnTab("CurrentPaneDomain") },
+  note = "named entries are ignored",
+}
+return config
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+        assert len(ctec.key_bindings) == 1
+        assert ctec.key_bindings[0].action == "SpawnTab"
+
+    def test_parse_sparse_default_prog(self):
+        """Arguments after a gap in default_prog are ignored, as with ipairs."""
+        content = """
+local config = {}
+config.default_prog = { "/bin/zsh", "-l", [4] = "-x" }
+return config
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+        assert ctec.behavior.shell == "/bin/zsh"
+        assert ctec.behavior.shell_args == ["-l"]
+
     def test_parse_colors(self):
         config_path = FIXTURES_DIR / "wezterm" / "wezterm.lua"
         ctec = WeztermAdapter.parse(config_path)
@@ -43,6 +168,15 @@ class TestWeztermAdapter:
         # With proper Lua execution, we no longer need warnings about complexity
         assert len(ctec.warnings) == 0
 
+    def test_parsed_colors_are_not_shared(self):
+        """Equal color strings must not return the same mutable Color."""
+        first = WeztermAdapter._parse_lua_color("#ff8000")
+        second = WeztermAdapter._parse_lua_color("#ff8000")
+        assert first == second == Color(255, 128, 0)
+        first.r = 0
+        assert second.r == 255
+        assert WeztermAdapter._parse_lua_color("#ff8000") == Color(255, 128, 0)
+
     def test_parse_cursor(self):
         config_path = FIXTURES_DIR / "wezterm" / "wezterm.lua"
         ctec = WeztermAdapter.parse(config_path)
@@ -126,6 +260,18 @@ return config
         assert ctec.font is not None
         assert ctec.font.ligatures is False
 
+    def test_parse_font_with_fallback_names(self):
+        content = """
+local wezterm = require 'wezterm'
+local config = wezterm.config_builder()
+config.font = wezterm.font_with_fallback({ "Fira Code", "Symbols Nerd Font" })
+return config
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+
+        assert ctec.font.family == "Fira Code"
+        assert ctec.font.fallback_fonts == ["Symbols Nerd Font"]
+
     def test_parse_leader_key(self):
         """Test parsing config.leader configuration."""
         content = """
@@ -160,6 +306,20 @@ return config
         assert any("event callbacks" in w.lower() for w in ctec.warnings)
         assert any("update-right-status" in w for w in ctec.warnings)
 
+    def test_parse_repeated_event_callbacks(self):
+        content = """
+local wezterm = require 'wezterm'
+for _ = 1, 3 do
+    wezterm.on('gui-startup', function() end)
+end
+wezterm.on('update-status', function() end)
+return {}
+"""
+        ctec = WeztermAdapter.parse("test.lua", content=content)
+
+        events = [s for s in ctec.terminal_specific if s.key == "event_callbacks"]
+        assert events[0].value == ["gui-startup", "update-status"]
+
     def test_export_action_syntax_copyto(self):
         """Test that CopyTo action exports with correct syntax."""
         ctec = CTEC(
@@ -317,6 +477,16 @@ return config
         assert 'active_titlebar_bg = "#222222"' in output
         assert 'inactive_titlebar_bg = "#333333"' in output
 
+    def test_export_window_frame_bool(self):
+        """Test WezTerm exports boolean window_frame values as Lua booleans."""
+        ctec = CTEC()
+        ctec.add_terminal_specific(
+            "wezterm", "window_frame", {"show_close_tab_button_in_tabs": False}
+        )
+
+        output = WeztermAdapter.export(ctec)
+        assert "show_close_tab_button_in_tabs = false," in output
+
     def test_parse_ssh_domains(self):
         """Test WezTerm parses ssh_domains for multiplexer configuration."""
         config = """